@@ -1,10 +1,44 @@
 from __future__ import annotations
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 from urllib.parse import urlencode
 
+from html_cache import cache_get, cache_put, is_no_store
+
+_POOL_SIZE = 16  # keep-alive connections per host (>= county worker count)
+
+
+_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def make_pooled_session(pool_size: int = _POOL_SIZE, retries: int = 3) -> requests.Session:
+    """
+    Session whose connection pool can serve *pool_size* concurrent threads,
+    so repeated GETs to one host reuse TCP/TLS connections.
+
+    Transient statuses / connection errors are retried at the transport
+    level (short backoff, honours Retry-After).  The final response is still
+    returned rather than raised, so callers' raise_for_status() handling of
+    429/5xx is unchanged.
+    """
+    session = requests.Session()
+    retry = Retry(
+        total=retries,
+        backoff_factor=0.2,
+        status_forcelist=_RETRY_STATUSES,
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
 @dataclass(frozen=True)
 class HttpConfig:
     timeout_s: int = 60
@@ -20,7 +54,7 @@ class BaseHttpClient:
         self.base_url = base_url
         self.config = config or HttpConfig()
 
-        self.session = requests.Session()
+        self.session = make_pooled_session()
         self.session.headers.update(
             {
                 "User-Agent": self.config.user_agent,
@@ -53,6 +87,7 @@ class StateHttpClient:
     config: "HttpConfig"
     search_path: str = "/search"   # default for VA, MA, etc.
     url_style: str = "path_params"  # "path_params" (VA/MA/NH) or "query_params" (CO)
+    session: Optional[requests.Session] = field(default=None, repr=False, compare=False)
 
     # ---------------------------
     # URL Builders
@@ -100,14 +135,19 @@ class StateHttpClient:
         )
         return f"{url}?{query}"
 
+    def detail_url_parts(self) -> tuple[str, str]:
+        """
+        (prefix, suffix) such that a detail URL is f"{prefix}{election_id}{suffix}".
+        Adjust here later if a state uses a different detail pattern.
+        """
+        return f"{self._normalize_base()}/view/", "/"
+
     def build_detail_url(self, election_id: int) -> str:
         """
         Builds detail page URL.
-        Adjust here later if a state uses a different detail pattern.
         """
-        base = self._normalize_base()
-        detail_url = f"{base}/view/{election_id}/"
-        return detail_url
+        prefix, suffix = self.detail_url_parts()
+        return f"{prefix}{election_id}{suffix}"
 
     # ---------------------------
     # HTTP Fetch
@@ -115,9 +155,26 @@ class StateHttpClient:
     def get_html(self, url: str) -> str:
         """
         Fetch HTML from a URL using this client's timeout and sleep config.
+
+        Served from the optional on-disk page cache (see ``html_cache``) when
+        enabled; cache hits skip the polite sleep.
         """
-        resp = requests.get(url, timeout=self.config.timeout_s)
-        resp.raise_for_status()
+        cached = cache_get(url)
+        if cached is not None:
+            return cached
+
+        getter = self.session.get if self.session is not None else requests.get
+        try:
+            resp = getter(url, timeout=self.config.timeout_s)
+            resp.raise_for_status()
+        except requests.RequestException:
+            stale = cache_get(url, allow_stale=True)
+            if stale is None:
+                raise
+            print(f"[WARN] Fetch failed; serving expired cached copy of {url}")
+            return stale
+        if not is_no_store(resp):
+            cache_put(url, resp.text)
 
         if self.config.sleep_s:
             time.sleep(self.config.sleep_s)
@@ -1,13 +1,14 @@
 from __future__ import annotations  # Enables postponed evaluation of type hints (Python 3.7+); helps with forward refs.
 
 # Standard library imports
-from dataclasses import asdict  # Convert dataclass instances into plain dicts (easy -> DataFrame).
-from concurrent.futures import ThreadPoolExecutor, as_completed  # Thread-based parallelism utilities.
+from dataclasses import fields  # Dataclass field names, for building DataFrames column by column.
+from concurrent.futures import ThreadPoolExecutor  # Thread-based parallelism utilities.
 from typing import Optional, List, Tuple, Dict  # Type annotations for readability + static checking.
+import sys
 import time
 
 # Third-party imports
-from lxml import html  # HTML parsing + XPath support.
+from lxml import etree, html  # HTML parsing + XPath support.
 import pandas as pd  # DataFrame construction/concatenation.
 
 # Local imports
@@ -19,6 +20,17 @@ from http_utils import fetch_with_retry
 from text_utils import parse_int as _parse_int, normalize_party
 from column_schemas import ES_PRECINCT_COLS
 
+_COUNTY_VOTE_FIELDS = tuple(f.name for f in fields(CountyVotes))
+
+# Detail-page results table (county and precinct parsers); compiled once
+_RESULTS_TABLE_XPATH = etree.XPath(
+    "//table[.//th["
+    "normalize-space()='County/City' "
+    "or normalize-space()='City/Town' "
+    "or normalize-space()='County'"
+    "]] | //table[@id='precinct_data']"
+)
+
 
 # -----------------------------------------------------------------------------
 # Header labels we want to ignore when parsing tables
@@ -384,13 +396,7 @@ def parse_county_votes_from_detail_html(
     #    We search for a <table> that contains a header cell with one of:
     #    County/City, City/Town, or County (robust across states).
     # ---------------------------------------------------
-    tables = doc.xpath(
-        "//table[.//th["
-        "normalize-space()='County/City' "
-        "or normalize-space()='City/Town' "
-        "or normalize-space()='County'"
-        "]] | //table[@id='precinct_data']"
-    )
+    tables = _RESULTS_TABLE_XPATH(doc)
 
     if not tables:
         # If we can't find the expected table, fail early with a clear error.
@@ -496,7 +502,11 @@ def parse_county_votes_from_detail_html(
     # ---------------------------------------------------
     # 11) Convert dataclass rows into a pandas DataFrame; attach total_votes when available.
     # ---------------------------------------------------
-    df = pd.DataFrame([asdict(r) for r in rows])
+    # Column lists by attribute access; asdict() would deep-copy every row
+    if rows:
+        df = pd.DataFrame({name: [getattr(r, name) for r in rows] for name in _COUNTY_VOTE_FIELDS})
+    else:
+        df = pd.DataFrame()
     if not df.empty and county_total_votes:
         df["total_votes"] = df["county_or_city"].map(county_total_votes)
     return df
@@ -701,6 +711,7 @@ def build_county_and_precinct_dataframe_v2(
     max_workers: int = 6,
     fetcher=None,
     meta_fetcher=None,
+    meta_batch_fetcher=None,
 ) -> "tuple[pd.DataFrame, pd.DataFrame]":
     """
     Download and parse county + precinct votes for v2 states (SC, NM, NY, VA)
@@ -727,6 +738,14 @@ def build_county_and_precinct_dataframe_v2(
         Playwright-based fetchers which are not thread-safe).  When ``None``
         (the default) a plain ``requests.get`` call is used inside a
         ``ThreadPoolExecutor``.
+    meta_fetcher : callable, optional
+        ``meta_fetcher(election_id) -> (csv_text, meta)`` browser-based fetcher,
+        run sequentially on the calling thread.
+    meta_batch_fetcher : callable, optional
+        ``meta_batch_fetcher(election_ids) -> {election_id: (csv_text, meta) | Exception}``.
+        Takes precedence over *meta_fetcher*; lets a browser client spread the
+        contests across its own parallel pages (e.g.
+        ``PlaywrightClient.fetch_contests_csv_and_type``).
 
     Returns
     -------
@@ -755,6 +774,14 @@ def build_county_and_precinct_dataframe_v2(
     unique = state_df[["state", "election_id"]].drop_duplicates()
     unique_rows = [(int(row["election_id"]), str(row["state"])) for _, row in unique.iterrows()]
 
+    def _parse_one(election_id: int, state: str, csv_text: str, meta: dict) -> "tuple[pd.DataFrame, pd.DataFrame]":
+        return _parse_contest_csv_v2(
+            csv_text, election_id, state, candidate_id_map,
+            election_type=meta.get("election_type", ""),
+            office=meta.get("office", ""),
+            district=meta.get("district", ""),
+        )
+
     def _fetch_one(election_id: int, state: str) -> "tuple[pd.DataFrame, pd.DataFrame]":
         if meta_fetcher is not None:
             # Browser-based fetcher: navigates to contest page, extracts election
@@ -767,14 +794,26 @@ def build_county_and_precinct_dataframe_v2(
             )
             csv_text = fetch_with_retry(_f, url)
             meta = {}
-        return _parse_contest_csv_v2(
-            csv_text, election_id, state, candidate_id_map,
-            election_type=meta.get("election_type", ""),
-            office=meta.get("office", ""),
-            district=meta.get("district", ""),
-        )
+        return _parse_one(election_id, state, csv_text, meta)
 
-    if meta_fetcher is not None or fetcher is not None:
+    if meta_batch_fetcher is not None:
+        # Browser batch: the fetcher owns its concurrency; parse in input order.
+        fetched = meta_batch_fetcher([eid for eid, _ in unique_rows])
+        for eid, state in unique_rows:
+            try:
+                result = fetched.get(eid)
+                if isinstance(result, Exception):
+                    raise result
+                if result is None:
+                    raise RuntimeError("no result returned")
+                c_df, p_df = _parse_one(eid, state, *result)
+                if not c_df.empty:
+                    county_frames.append(c_df)
+                if not p_df.empty:
+                    precinct_frames.append(p_df)
+            except Exception as exc:
+                print(f"  [ElectionStats] WARN: CSV download failed for election_id={eid}: {exc}", flush=True)
+    elif meta_fetcher is not None or fetcher is not None:
         # Non-thread-safe fetcher (Playwright): run sequentially on calling thread.
         for eid, state in unique_rows:
             try:
@@ -944,6 +983,7 @@ def build_county_dataframe_parallel(
     state_df: pd.DataFrame,
     client_factory,
     max_workers: int = 6,
+    buffersize: Optional[int] = None,
 ) -> pd.DataFrame:
     """
     Parallel version of build_county_dataframe using ThreadPoolExecutor.
@@ -959,6 +999,9 @@ def build_county_dataframe_parallel(
         Used to ensure thread safety.
     max_workers : int
         Number of threads.
+    buffersize : int, optional
+        Cap on elections submitted ahead of the consumer (Python 3.14+;
+        ignored on older interpreters).  ``None`` submits everything upfront.
 
     Returns
     -------
@@ -1001,17 +1044,15 @@ def build_county_dataframe_parallel(
 
     frames: List[pd.DataFrame] = []
 
+    def _run(job: Tuple[Optional[str], int, str]) -> Optional[pd.DataFrame]:
+        st, election_id, url = job
+        return _fetch_and_parse_one_parallel(st, election_id, url, candidate_id_map, client_factory)
+
     # ThreadPoolExecutor schedules IO-bound tasks well (HTTP fetches + parsing).
+    # map() yields in job order; buffersize (3.14+) bounds the pending futures.
+    map_kwargs = {"buffersize": buffersize} if buffersize and sys.version_info >= (3, 14) else {}
     with ThreadPoolExecutor(max_workers=max_workers) as ex:
-        # Submit all jobs to the thread pool.
-        futures = [
-            ex.submit(_fetch_and_parse_one_parallel, st, election_id, url, candidate_id_map, client_factory)
-            for st, election_id, url in jobs
-        ]
-
-        # as_completed yields futures as they finish (not necessarily submission order).
-        for fut in as_completed(futures):
-            df_one = fut.result()
+        for df_one in ex.map(_run, jobs, **map_kwargs):
             if df_one is not None and not df_one.empty:
                 frames.append(df_one)
 
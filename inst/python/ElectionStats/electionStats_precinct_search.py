@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List, Tuple, Dict
 
 from lxml import html
@@ -16,6 +17,7 @@ from .electionStats_county_search import (
     parse_county_votes_from_detail_html,
     _build_candidate_id_map_from_state_df,
     _PRECINCT_COLS,
+    _RESULTS_TABLE_XPATH,
 )
 
 from http_utils import fetch_with_retry
@@ -211,13 +213,7 @@ def parse_precinct_votes_from_detail_html(
 
     doc = html.fromstring(detail_html)
 
-    tables = doc.xpath(
-        "//table[.//th["
-        "normalize-space()='County/City' "
-        "or normalize-space()='City/Town' "
-        "or normalize-space()='County'"
-        "]] | //table[@id='precinct_data']"
-    )
+    tables = _RESULTS_TABLE_XPATH(doc)
     if not tables:
         return EMPTY
 
@@ -427,6 +423,7 @@ def build_county_and_precinct_dataframe_parallel(
     state_df: pd.DataFrame,
     client_factory,
     max_workers: int = 6,
+    buffersize: Optional[int] = None,
 ) -> Tuple[pd.DataFrame, pd.DataFrame]:
     """
     Parallel version that fetches each detail page **once** and returns both
@@ -441,6 +438,9 @@ def build_county_and_precinct_dataframe_parallel(
         Returns a new client instance per thread.
     max_workers : int
         Thread pool size.
+    buffersize : int, optional
+        Cap on elections submitted ahead of the consumer (Python 3.14+;
+        ignored on older interpreters).  ``None`` submits everything upfront.
 
     Returns
     -------
@@ -479,24 +479,24 @@ def build_county_and_precinct_dataframe_parallel(
     county_frames: List[pd.DataFrame] = []
     precinct_frames: List[pd.DataFrame] = []
 
-    with ThreadPoolExecutor(max_workers=max_workers) as ex:
-        futures = {
-            ex.submit(
-                _fetch_and_parse_county_and_precinct,
+    def _run(job: Tuple[Optional[str], int, str]):
+        st, election_id, url = job
+        try:
+            return _fetch_and_parse_county_and_precinct(
                 st, election_id, url, candidate_id_map, client_factory,
-            ): election_id
-            for st, election_id, url in jobs
-        }
-        for fut in as_completed(futures):
-            eid = futures[fut]
-            try:
-                c_df, p_df = fut.result()
-                if c_df is not None and not c_df.empty:
-                    county_frames.append(c_df)
-                if p_df is not None and not p_df.empty:
-                    precinct_frames.append(p_df)
-            except Exception as exc:
-                print(f"  [ElectionStats] WARN: county/precinct failed for election_id={eid}: {exc}", flush=True)
+            )
+        except Exception as exc:
+            print(f"  [ElectionStats] WARN: county/precinct failed for election_id={election_id}: {exc}", flush=True)
+            return None, None
+
+    # map() yields in job order; buffersize (3.14+) bounds the pending futures.
+    map_kwargs = {"buffersize": buffersize} if buffersize and sys.version_info >= (3, 14) else {}
+    with ThreadPoolExecutor(max_workers=max_workers) as ex:
+        for c_df, p_df in ex.map(_run, jobs, **map_kwargs):
+            if c_df is not None and not c_df.empty:
+                county_frames.append(c_df)
+            if p_df is not None and not p_df.empty:
+                precinct_frames.append(p_df)
 
     county_df   = pd.concat(county_frames,   ignore_index=True) if county_frames   else pd.DataFrame(columns=county_cols)
     precinct_df = pd.concat(precinct_frames, ignore_index=True) if precinct_frames else pd.DataFrame(columns=_PRECINCT_COLS)
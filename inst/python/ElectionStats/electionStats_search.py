@@ -1,12 +1,17 @@
 from __future__ import annotations
 
 import re
-from dataclasses import asdict
-from typing import Iterable, List, Optional, Tuple
-
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from dataclasses import fields
+from functools import lru_cache
+from itertools import islice
+from typing import Iterable, List, Optional, Tuple, Union
+
+import numpy as np
 import pandas as pd
 import requests
-from lxml import html
+from lxml import etree, html
 
 from .electionStats_client import StateHttpClient
 from .electionStats_models import ElectionSearchRow
@@ -15,7 +20,75 @@ from office_level_utils import lookup_office_level
 from text_utils import clean_text as _clean_ws, parse_int as _parse_int, parse_percentage as _parse_percentage, normalize_party
 
 # Accept both VA/MA: election-id-#### and CO: contest-id-####
-_ROW_ID_RE = re.compile(r"^(?:election|contest)-id-(\d+)$")
+_ROW_ID_PREFIXES = ("election-id-", "contest-id-")
+
+# Streaming row match per scraper type, evaluated on each closed <tr>
+_V2_ROW_MATCH = etree.XPath(
+    "boolean(parent::tbody and ancestor::table[@id='contestCollectionTable'])"
+)
+_CLASSIC_ROW_MATCH = etree.XPath(
+    "boolean(ancestor::table[@id='search_results_table'] and "
+    "(starts-with(@id,'election-id-') or starts-with(@id,'contest-id-')))"
+)
+# Per-row lookups, compiled once rather than on every row
+_CANDIDATES_TABLE = etree.XPath(
+    ".//table[contains(concat(' ', normalize-space(@class), ' '), ' candidates ')]"
+)
+_CANDIDATE_ROWS = etree.XPath(".//tbody/tr")
+_CANDIDATE_NAME = etree.XPath(".//div[contains(@class,'name')]/a")
+_CANDIDATE_PARTY = etree.XPath(".//div[contains(@class,'party')]")
+_CO_YEAR_TH = etree.XPath("./th[contains(@class,'year')]")
+_CO_DATE_YEAR = etree.XPath(".//span[contains(@class,'date-year')]/text()")
+_CO_STAGE_TD = etree.XPath("./td[contains(@class,'party_border_top')]")
+_CO_OFFICE_TD = etree.XPath("./td[contains(@class,'office')]")
+_CO_DISTRICT_TD = etree.XPath("./td[contains(@class,'division')]")
+_CO_CANDIDATES_TD = etree.XPath("./td[contains(@class,'candidates_container_cell')]")
+_LINK_HREFS = etree.XPath(".//a/@href")
+_YEAR_RE = re.compile(r"\b(19|20)\d{2}\b")
+
+_HTML_LOOKUP = html.HtmlElementClassLookup()
+_FEED_CHUNK = 64 * 1024
+
+
+def _iter_row_elements(page_html: Union[str, bytes, Iterable[bytes]], row_match):
+    """
+    Stream-parse *page_html* and yield each matching search-result <tr>.
+
+    Rows are cleared (along with already-processed siblings) once the caller
+    resumes, so memory stays bounded by a single row rather than the page.
+    """
+    if isinstance(page_html, (str, bytes)):
+        chunks = (page_html[i:i + _FEED_CHUNK] for i in range(0, len(page_html), _FEED_CHUNK))
+    else:
+        chunks = page_html
+
+    parser = etree.HTMLPullParser(events=("end",), tag="tr", encoding="utf-8", recover=True)
+    parser.set_element_class_lookup(_HTML_LOOKUP)
+
+    def _drain():
+        for _, tr in parser.read_events():
+            if not row_match(tr):
+                continue  # e.g. nested candidate-table rows; kept for the outer row
+            yield tr
+            tr.clear()
+            parent = tr.getparent()
+            while parent is not None and tr.getprevious() is not None:
+                del parent[0]
+
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from _drain()
+    parser.close()
+    yield from _drain()
+
+# Search-result pages fetched concurrently per pagination window
+_PAGE_WINDOW = 4
+
+# Stop paginating once a page's (election_id, candidate_id) keys overlap an
+# earlier page at least this much — sites that loop re-emit shuffled pages.
+_NEAR_DUP_JACCARD = 0.95
+
+_ROW_FIELDS = tuple(f.name for f in fields(ElectionSearchRow))
 
 
 # =============================
@@ -78,16 +151,14 @@ def _find_candidates_table(candidates_cell):
     """
     if candidates_cell is None:
         return None
-    tables = candidates_cell.xpath(
-        ".//table[contains(concat(' ', normalize-space(@class), ' '), ' candidates ')]"
-    )
+    tables = _CANDIDATES_TABLE(candidates_cell)
     return tables[0] if tables else None
 
 
 def _iter_candidate_rows(candidates_table):
     if candidates_table is None:
         return []
-    return candidates_table.xpath(".//tbody/tr")
+    return _CANDIDATE_ROWS(candidates_table)
 
 
 def _is_special_candidate_row(tr) -> bool:
@@ -118,7 +189,7 @@ def _extract_candidate_name(tr) -> Optional[str]:
       - <th class="candidate"><div class="name"><a>NAME</a>...
       - <td class="candidate"><div class="name"><a>NAME</a>...
     """
-    name_nodes = tr.xpath(".//div[contains(@class,'name')]/a")
+    name_nodes = _CANDIDATE_NAME(tr)
     if not name_nodes:
         return None
     name = _safe_text(name_nodes[0])
@@ -126,11 +197,16 @@ def _extract_candidate_name(tr) -> Optional[str]:
 
 
 def _extract_party(tr) -> Optional[str]:
-    party_nodes = tr.xpath(".//div[contains(@class,'party')]")
+    party_nodes = _CANDIDATE_PARTY(tr)
     party = _safe_text(party_nodes[0]) if party_nodes else ""
     return party or None
 
 
+def _row_cells(tr) -> list:
+    """Direct <th>/<td> children of *tr*, in document order."""
+    return [c for c in tr if c.tag in ("th", "td")]
+
+
 def _extract_vote_count(tr) -> Optional[int]:
     """
     Colorado candidate rows are: <th candidate> + <td votes> + <td pct>
@@ -138,14 +214,14 @@ def _extract_vote_count(tr) -> Optional[int]:
 
     So: read cells as (th|td) and take index 1 for votes.
     """
-    cells = tr.xpath("./th|./td")
+    cells = _row_cells(tr)
     if len(cells) < 2:
         return None
     return _parse_int(_safe_text(cells[1]))
 
 
 def _extract_vote_percentage(tr) -> Optional[str]:
-    cells = tr.xpath("./th|./td")
+    cells = _row_cells(tr)
     if len(cells) < 3:
         return None
     pct = _safe_text(cells[2])
@@ -211,7 +287,7 @@ def _extract_year_from_colorado_year_th(th_node) -> Optional[int]:
     if th_node is None:
         return None
 
-    y = th_node.xpath(".//span[contains(@class,'date-year')]/text()")
+    y = _CO_DATE_YEAR(th_node)
     if y:
         try:
             return int(y[0].strip())
@@ -219,30 +295,38 @@ def _extract_year_from_colorado_year_th(th_node) -> Optional[int]:
             pass
 
     txt = _safe_text(th_node)
-    m = re.search(r"\b(19|20)\d{2}\b", txt)
+    m = _YEAR_RE.search(txt)
     return int(m.group(0)) if m else None
 
 
+def _row_election_id(tr_id: str) -> Optional[int]:
+    """Numeric id from a row id like ``election-id-1234`` / ``contest-id-1234``."""
+    for prefix in _ROW_ID_PREFIXES:
+        if tr_id.startswith(prefix):
+            suffix = tr_id[len(prefix):]
+            # isascii: str.isdigit alone also accepts e.g. superscript digits
+            return int(suffix) if suffix.isascii() and suffix.isdigit() else None
+    return None
+
+
 def _parse_search_row_colorado(tr) -> Optional[Tuple[int, int, str, str, str, object]]:
     """
     Returns:
       (election_id, year, stage, office, district, candidates_cell)
     """
-    tr_id = tr.get("id") or ""
-    m = _ROW_ID_RE.match(tr_id)
-    if not m:
+    election_id = _row_election_id(tr.get("id") or "")
+    if election_id is None:
         return None
-    election_id = int(m.group(1))
 
-    year_th = (tr.xpath("./th[contains(@class,'year')]") or [None])[0]
+    year_th = (_CO_YEAR_TH(tr) or [None])[0]
     year = _extract_year_from_colorado_year_th(year_th)
     if year is None:
         return None
 
-    stage_node = (tr.xpath("./td[contains(@class,'party_border_top')]") or [None])[0]
-    office_node = (tr.xpath("./td[contains(@class,'office')]") or [None])[0]
-    district_node = (tr.xpath("./td[contains(@class,'division')]") or [None])[0]
-    candidates_cell = (tr.xpath("./td[contains(@class,'candidates_container_cell')]") or [None])[0]
+    stage_node = (_CO_STAGE_TD(tr) or [None])[0]
+    office_node = (_CO_OFFICE_TD(tr) or [None])[0]
+    district_node = (_CO_DISTRICT_TD(tr) or [None])[0]
+    candidates_cell = (_CO_CANDIDATES_TD(tr) or [None])[0]
 
     stage = _safe_text(stage_node)
     office = _safe_text(office_node)
@@ -261,13 +345,11 @@ def _parse_search_row_vtma(tr) -> Optional[Tuple[int, int, str, str, str, object
     Returns:
       (election_id, year, stage, office, district, candidates_cell)
     """
-    tr_id = tr.get("id") or ""
-    m = _ROW_ID_RE.match(tr_id)
-    if not m:
+    election_id = _row_election_id(tr.get("id") or "")
+    if election_id is None:
         return None
-    election_id = int(m.group(1))
 
-    tds = tr.xpath("./td")
+    tds = tr.findall("td")
     if len(tds) < 5:
         return None
 
@@ -280,7 +362,7 @@ def _parse_search_row_vtma(tr) -> Optional[Tuple[int, int, str, str, str, object
     try:
         year = int(year_txt)
     except ValueError:
-        m_year = re.search(r"\b(19|20)\d{2}\b", year_txt)
+        m_year = _YEAR_RE.search(year_txt)
         if not m_year:
             return None
         year = int(m_year.group(0))
@@ -413,7 +495,7 @@ def _parse_search_row_v2(tr) -> Optional[Tuple[int, int, str, str, str, str]]:
     Returns:
       (election_id, year, stage, office, district, results_text)
     """
-    tds = tr.xpath("./td")
+    tds = tr.findall("td")
     if len(tds) < 5:
         return None
 
@@ -425,13 +507,13 @@ def _parse_search_row_v2(tr) -> Optional[Tuple[int, int, str, str, str, str]]:
     results_text = _safe_text(tds[4])
 
     # Extract year from date (e.g., "Nov 2024" -> 2024)
-    year_match = re.search(r"\b(19|20)\d{2}\b", date_text)
+    year_match = _YEAR_RE.search(date_text)
     if not year_match:
         return None
     year = int(year_match.group(0))
 
     # Extract election_id from link (e.g., /contest/8119 -> 8119)
-    link = tds[4].xpath(".//a/@href")
+    link = _LINK_HREFS(tds[4])
     if not link:
         return None
 
@@ -465,40 +547,47 @@ def _choose_row_parser(state_key: str):
     return _parse_search_row_vtma
 
 
+@lru_cache(maxsize=64)
+def _resolve_state(state_name: str):
+    """
+    Resolve the parsing strategy for a state once and reuse it across pages.
+
+    Returns:
+      (row_match, row_parser, candidate_extractor)
+    """
+    if get_scraper_type(state_name) == "v2":
+        return _V2_ROW_MATCH, _choose_row_parser(state_name), _parse_v2_results_text
+    return _CLASSIC_ROW_MATCH, _choose_row_parser(state_name), _extract_candidates_table
+
+
 # =============================
 # Main parser
 # =============================
-def parse_search_results(page_html: str, client, state_name: str, url: str) -> List[ElectionSearchRow]:
+def parse_search_results(
+    page_html: Union[str, bytes, Iterable[bytes]],
+    client,
+    state_name: str,
+    url: str,
+) -> List[ElectionSearchRow]:
     """
     Parse search results HTML for both classic and v2 states.
-    """
-    doc = html.fromstring(page_html)
-    scraper_type = get_scraper_type(state_name)
 
-    if scraper_type == "v2":
-        trs = doc.xpath("//table[@id='contestCollectionTable']//tbody/tr")
-    else:
-        trs = doc.xpath(
-            "//table[@id='search_results_table']//tr["
-            "starts-with(@id,'election-id-') or starts-with(@id,'contest-id-')"
-            "]"
-        )
+    *page_html* may be the full page or an iterable of byte chunks; rows are
+    parsed as they close, so large result tables are never held in full.
+    """
+    row_match, parse_row, extract_candidates = _resolve_state(state_name)
 
-    parse_row = _choose_row_parser(state_name)
     out: List[ElectionSearchRow] = []
 
-    for row_num, tr in enumerate(trs, start=1):
+    for row_num, tr in enumerate(_iter_row_elements(page_html, row_match), start=1):
         parsed = parse_row(tr)
 
         if parsed is None:
             continue
 
-        if scraper_type == "v2":
-            election_id, year, stage, office, district, results_text = parsed
-            candidate_rows = _parse_v2_results_text(results_text)
-        else:
-            election_id, year, stage, office, district, candidates_cell = parsed
-            candidate_rows = _extract_candidates_table(candidates_cell)
+        # v2 rows carry the results summary text; classic rows the candidates cell
+        election_id, year, stage, office, district, candidates_payload = parsed
+        candidate_rows = extract_candidates(candidates_payload)
 
         if not candidate_rows:
             continue
@@ -539,6 +628,12 @@ def parse_search_results(page_html: str, client, state_name: str, url: str) -> L
 # =============================
 # Fetch helpers
 # =============================
+def _jaccard(a: frozenset, b: frozenset) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
 def fetch_search_results(
     client: StateHttpClient,
     year_from: int = 1789,
@@ -571,8 +666,10 @@ def fetch_search_results_dicts(
     year_to: int = 2025,
     page: int = 1,
 ) -> List[dict]:
-    rows = fetch_search_results(client, state_key=state_key, year_from=year_from, year_to=year_to, page=page)
-    return [asdict(r) | {"url": client.build_detail_url(r.election_id)} for r in rows]
+    rows = fetch_search_results(client, year_from=year_from, year_to=year_to, page=page, state_name=state_key)
+    # Rows hold only scalars, so the shallow __dict__ equals asdict() without its deep copy
+    build = client.build_detail_url
+    return [{**r.__dict__, "url": build(r.election_id)} for r in rows]
 
 
 def iter_search_results(
@@ -582,48 +679,86 @@ def iter_search_results(
     start_page: int = 1,
     max_pages: int = 200,
     state_name: str | None = None,   # ✅ added
+    window: int = _PAGE_WINDOW,
 ) -> Iterable[ElectionSearchRow]:
+    """
+    Yield de-duplicated search rows page by page.
 
+    Pages are fetched speculatively in windows of *window* concurrent requests
+    and consumed in page order; pagination stops at the first empty page, the
+    first page with no new rows, a page that near-duplicates an earlier one
+    (Jaccard >= ``_NEAR_DUP_JACCARD``), or a transient error past page 1.  Pages
+    whose URL repeats an earlier one (path-param sites ignore ``page``) are
+    never requested.
+    """
     seen_keys: set[tuple[int, int]] = set()
+    seen_urls: set[str] = set()
+    page_key_sets: list[frozenset] = []
     page = start_page
+    end_page = start_page + max_pages
 
-    for _ in range(max_pages):
-        try:
-            rows = fetch_search_results(
-                client,
-                year_from=year_from,
-                year_to=year_to,
-                page=page,
-                state_name=state_name,
-            )
-        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
-            if page > 1:
-                print(f"  [INFO] Pagination stopped at page {page} (network error — treating as end of results): {e}")
-                break
-            raise
-        except requests.exceptions.HTTPError as e:
-            resp = getattr(e, "response", None)
-            if page > 1 and resp is not None and resp.status_code in (429, 500, 502, 503, 504):
-                print(f"  [INFO] Pagination stopped at page {page} (HTTP {resp.status_code} — treating as end of results)")
-                break
-            raise
-
-        if not rows:
-            break
-
-        new_rows = [
-            r for r in rows
-            if (r.election_id, r.candidate_id) not in seen_keys
-        ]
-
-        if not new_rows:
-            break
-
-        for r in new_rows:
-            seen_keys.add((r.election_id, r.candidate_id))
-            yield r
-
-        page += 1
+    ex = ThreadPoolExecutor(max_workers=max(1, window))
+    try:
+        while page < end_page:
+            batch = []
+            for p in range(page, min(page + window, end_page)):
+                url = client.build_search_url(year_from=year_from, year_to=year_to, page=p)
+                if url in seen_urls:
+                    break
+                seen_urls.add(url)
+                batch.append((p, ex.submit(
+                    fetch_search_results,
+                    client,
+                    year_from=year_from,
+                    year_to=year_to,
+                    page=p,
+                    state_name=state_name,
+                )))
+
+            if not batch:
+                return
+
+            for p, fut in batch:
+                try:
+                    rows = fut.result()
+                except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as e:
+                    if p > 1:
+                        print(f"  [INFO] Pagination stopped at page {p} (network error — treating as end of results): {e}")
+                        rows = []
+                    else:
+                        raise
+                except requests.exceptions.HTTPError as e:
+                    resp = getattr(e, "response", None)
+                    if p > 1 and resp is not None and resp.status_code in (429, 500, 502, 503, 504):
+                        print(f"  [INFO] Pagination stopped at page {p} (HTTP {resp.status_code} — treating as end of results)")
+                        rows = []
+                    else:
+                        raise
+
+                page_keys = frozenset((r.election_id, r.candidate_id) for r in rows)
+                near_dup = any(_jaccard(page_keys, prev) >= _NEAR_DUP_JACCARD for prev in page_key_sets)
+                page_key_sets.append(page_keys)
+
+                any_new = False
+                for r in rows:
+                    key = (r.election_id, r.candidate_id)
+                    if key in seen_keys:
+                        continue
+                    seen_keys.add(key)
+                    any_new = True
+                    yield r
+
+                if not any_new or near_dup:
+                    if near_dup and any_new:
+                        print(f"  [INFO] Pagination stopped at page {p} (page repeats an earlier page)")
+                    for _, pending in batch:
+                        pending.cancel()
+                    return
+
+            page += len(batch)
+    finally:
+        # Also reached when a consumer closes the generator early: drop queued pages
+        ex.shutdown(wait=True, cancel_futures=True)
 
 
 
@@ -634,17 +769,25 @@ def fetch_all_search_results(
     start_page: int = 1,
     max_pages: int = 200,
     state_name: str | None = None,   
+    limit: int | None = None,
 ) -> List[ElectionSearchRow]:
-    return list(
-        iter_search_results(
-            client,
-            year_from=year_from,
-            year_to=year_to,
-            start_page=start_page,
-            max_pages=max_pages,
-            state_name=state_name,   
-        )
+    """
+    Collect search rows from :func:`iter_search_results`.
+
+    With *limit*, stop after that many rows; pages beyond the one holding
+    the last row are never requested.
+    """
+    rows = iter_search_results(
+        client,
+        year_from=year_from,
+        year_to=year_to,
+        start_page=start_page,
+        max_pages=max_pages,
+        state_name=state_name,   
     )
+    # closing() stops the page fetcher as soon as enough rows are in hand
+    with closing(rows):
+        return list(islice(rows, limit))
 
 
 
@@ -705,13 +848,27 @@ def rows_to_dataframe(rows: list[ElectionSearchRow], client) -> pd.DataFrame:
     pd.DataFrame
         DataFrame with election results and url column
     """
+    if not rows:
+        return pd.DataFrame()
+
+    # Build column lists by attribute access (asdict deep-copies every row)
+    cols = {name: [getattr(r, name) for r in rows] for name in _ROW_FIELDS}
+    for name in ("election_id", "candidate_id"):
+        cols[name] = np.fromiter(cols[name], dtype=np.int64, count=len(rows))
+
     # Check for build_detail_url method to distinguish client types
     # StateHttpClient has this method (uses /view/ URLs for MA/CO/NH/ID/VT)
     # PlaywrightClient does not (uses /contest/ URLs for SC/NM/NY/VA)
-    if hasattr(client, 'build_detail_url'):
-        # StateHttpClient (classic states: MA/CO/NH/ID/VT)
-        records = [asdict(r) | {"url": client.build_detail_url(r.election_id)} for r in rows]
+    ids = cols["election_id"].tolist()
+    if hasattr(client, 'detail_url_parts'):
+        # StateHttpClient (classic states: MA/CO/NH/ID/VT): template resolved once
+        prefix, suffix = client.detail_url_parts()
+    elif hasattr(client, 'build_detail_url'):
+        # Other client exposing only the per-id builder
+        cols["url"] = [client.build_detail_url(eid) for eid in ids]
+        return pd.DataFrame(cols, copy=False)
     else:
         # PlaywrightClient (v2 states: SC/NM/NY/VA)
-        records = [asdict(r) | {"url": f"{client.base_url}/contest/{r.election_id}"} for r in rows]
-    return pd.DataFrame.from_records(records)
+        prefix, suffix = f"{client.base_url}/contest/", ""
+    cols["url"] = [f"{prefix}{eid}{suffix}" for eid in ids]
+    return pd.DataFrame(cols, copy=False)
@@ -16,14 +16,58 @@ Inherits browser lifecycle from BasePlaywrightClient (playwright_base.py).
 
 from __future__ import annotations
 
+import atexit
+import re
+import threading
 import time
-from typing import Optional
+from datetime import date
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Union
 
 from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
 
-from playwright_base import BasePlaywrightClient
+from html_cache import cache_get, cache_put, cached_fetch
+from playwright_base import PLAYWRIGHT_POOL, BasePlaywrightClient
 from ElectionStats.state_config import get_state_config
 
+_V2_ROW_SELECTOR = "table#contestCollectionTable tbody tr"
+_CLASSIC_ROW_SELECTOR = "table#search_results_table tbody tr[id]"
+
+# Never needed for the rendered tables/CSVs; aborting them cuts bytes and render time
+_BLOCKED_RESOURCE_TYPES = frozenset({
+    "image", "imageset", "media", "font", "stylesheet", "texttrack",
+    "websocket", "beacon", "csp_report",
+})
+
+_V2_TABLE_SELECTOR = "table#contestCollectionTable"
+_CLASSIC_TABLE_SELECTOR = "table#search_results_table"
+
+# True once the row count equals the previous poll's count and is non-zero,
+# or zero with the results table already rendered (an empty year)
+_STABLE_ROWS_JS = """([sel, container]) => {
+    const n = document.querySelectorAll(sel).length;
+    const settled = n > 0 || document.querySelector(container) !== null;
+    const stable = settled && window.__dbRowCount === n;
+    window.__dbRowCount = n;
+    return stable;
+}"""
+
+# True once v2 result rows or the "No Results Found" message have rendered
+_V2_ROWS_OR_EMPTY_JS = """(sel) => {
+    if (document.querySelector(sel) !== null) return true;
+    return Array.from(document.querySelectorAll("span.MuiTypography-body1"))
+        .some((el) => el.textContent.includes("No Results Found"));
+}"""
+
+
+def _has_result_rows(html_text: str) -> bool:
+    """True when *html_text* holds at least one results-table body row."""
+    from lxml import html as _lhtml
+    try:
+        return bool(_lhtml.fromstring(html_text).xpath("//table//tbody/tr"))
+    except Exception:
+        return False
+
 
 class PlaywrightClient(BasePlaywrightClient):
     """Browser automation client for states that need JS rendering.
@@ -40,7 +84,9 @@ class PlaywrightClient(BasePlaywrightClient):
     headless : bool, optional
         Whether to run browser in headless mode (default: True)
     sleep_s : float, optional
-        Sleep duration after page loads to ensure content stability (default: 2.0)
+        Extra fixed sleep after each targeted wait (default: 0.0).  Navigation
+        already waits on the result rows / page title themselves, so this is
+        only needed when debugging a slow site.
 
     Examples
     --------
@@ -49,12 +95,19 @@ class PlaywrightClient(BasePlaywrightClient):
     ...     # Process rendered HTML...
     """
 
+    # Years and contests run back to back on the main thread; batch workers
+    # release their thread's browser themselves (see _release_thread).
+    use_pool = True
+    # Scripts and XHR still load, so the SPA and Cloudflare checks are unaffected
+    blocked_resource_types = _BLOCKED_RESOURCE_TYPES
+    block_analytics = True
+
     def __init__(
         self,
         state_key: str,
         base_url: str,
         headless: bool = True,
-        sleep_s: float = 2.0,
+        sleep_s: float = 0.0,
     ):
         super().__init__(headless=headless, sleep_s=sleep_s)
         self.state_key = state_key
@@ -93,6 +146,25 @@ class PlaywrightClient(BasePlaywrightClient):
 
     def get_search_page(
         self, year_from: Optional[int] = None, year_to: Optional[int] = None
+    ) -> str:
+        """Return the rendered search page HTML (see :meth:`_render_search_page`).
+
+        Served from the optional on-disk page cache (``html_cache``) when enabled.
+        Ranges reaching the current year are always fetched live (results may
+        still be coming in), and only pages with at least one result row are
+        cached.
+        """
+        if year_to is None or year_to >= date.today().year:
+            return self._render_search_page(year_from, year_to)
+        url = self._build_search_url(year_from, year_to)
+        return cached_fetch(
+            url,
+            lambda _url: self._render_search_page(year_from, year_to),
+            should_store=_has_result_rows,
+        )
+
+    def _render_search_page(
+        self, year_from: Optional[int] = None, year_to: Optional[int] = None
     ) -> str:
         """Navigate to search page, wait for table to load, return rendered HTML.
 
@@ -135,12 +207,14 @@ class PlaywrightClient(BasePlaywrightClient):
             # are injected — we wait for the first contest row to appear.
             try:
                 self.page.wait_for_selector(
-                    "table#search_results_table tbody tr[id]",
+                    _CLASSIC_ROW_SELECTOR,
                     timeout=45000,
                 )
             except PlaywrightTimeoutError:
                 # No rows appeared — could be a genuinely empty year.
                 pass
+            else:
+                self._wait_for_stable_rows(_CLASSIC_ROW_SELECTOR, _CLASSIC_TABLE_SELECTOR)
         else:
             # v2 states (SC, NM, NY, VA): React/MUI table or "No Results" span.
             try:
@@ -152,6 +226,17 @@ class PlaywrightClient(BasePlaywrightClient):
             except PlaywrightTimeoutError:
                 raise
 
+            # The table shell can render before React fills it; wait for rows
+            # (or the "No Results Found" message, so empty years return at once).
+            try:
+                self.page.wait_for_function(
+                    _V2_ROWS_OR_EMPTY_JS, arg=_V2_ROW_SELECTOR, polling=100, timeout=15_000
+                )
+            except PlaywrightTimeoutError:
+                pass
+            if self.sleep_s:
+                time.sleep(self.sleep_s)
+
             # If the page loaded a "No Results Found" span rather than a table, return early.
             no_results = self.page.locator(
                 "span.MuiTypography-root.MuiTypography-body1"
@@ -159,8 +244,7 @@ class PlaywrightClient(BasePlaywrightClient):
             if no_results.count() > 0:
                 return self.page.content()
 
-            if self.sleep_s:
-                time.sleep(self.sleep_s)
+            self._wait_for_stable_rows(_V2_ROW_SELECTOR, _V2_TABLE_SELECTOR)
 
             # Paginate through all pages by clicking "Go to next page" until disabled,
             # collecting tbody rows from each page into one synthetic HTML document.
@@ -178,8 +262,10 @@ class PlaywrightClient(BasePlaywrightClient):
                 if next_btn.count() == 0:
                     break
 
+                first_row = self._first_row_text()
                 next_btn.first.click()
-                time.sleep(self.sleep_s or 1.5)
+                self._wait_for_rows_change(first_row)
+                self._wait_for_stable_rows(_V2_ROW_SELECTOR, _V2_TABLE_SELECTOR)
 
             return (
                 '<table id="contestCollectionTable"><tbody>'
@@ -187,11 +273,50 @@ class PlaywrightClient(BasePlaywrightClient):
                 + "</tbody></table>"
             )
 
+        return self.page.content()
+
+    def _wait_for_stable_rows(
+        self, row_selector: str, container_selector: str, timeout_ms: int = 10_000
+    ) -> None:
+        """Wait until the number of *row_selector* matches is unchanged across
+        two 100 ms polls (tables fill in batches).  A count of zero only
+        counts as settled once *container_selector* has rendered."""
+        self.page.evaluate("() => { window.__dbRowCount = -1; }")
+        try:
+            self.page.wait_for_function(
+                _STABLE_ROWS_JS,
+                arg=[row_selector, container_selector],
+                polling=100,
+                timeout=timeout_ms,
+            )
+        except PlaywrightTimeoutError:
+            pass  # still changing / empty — take what is there
+
+    def _first_row_text(self) -> str:
+        """Text of the first v2 result row ('' when absent)."""
+        row = self.page.locator(_V2_ROW_SELECTOR).first
+        return row.inner_text() if row.count() else ""
+
+    def _wait_for_rows_change(self, previous_first_row: str) -> None:
+        """Wait until the v2 table's first row differs from *previous_first_row*.
+
+        Used after clicking "next page": MUI swaps the rows in place, so a
+        selector wait would match the stale page immediately.
+        """
+        try:
+            self.page.wait_for_function(
+                """(prev) => {
+                    const r = document.querySelector(%r);
+                    return r !== null && r.innerText !== prev;
+                }""" % _V2_ROW_SELECTOR,
+                arg=previous_first_row,
+                timeout=15_000,
+            )
+        except PlaywrightTimeoutError:
+            print("  [WARN] Next page did not change the results table; continuing")
         if self.sleep_s:
             time.sleep(self.sleep_s)
 
-        return self.page.content()
-
     def get_html(self, url: str) -> str:
         """Fetch a contest detail page by URL, extracting election_id from the path.
 
@@ -200,7 +325,6 @@ class PlaywrightClient(BasePlaywrightClient):
 
         Expected URL form: {base_url}/contest/{election_id}
         """
-        import re
         m = re.search(r"/contest/(\d+)", url)
         if not m:
             raise ValueError(f"Cannot extract election_id from URL: {url}")
@@ -251,6 +375,13 @@ class PlaywrightClient(BasePlaywrightClient):
             raise RuntimeError("Browser not initialized. Use context manager (with statement).")
 
         self._navigate(f"{self.base_url}/contest/{election_id}")
+        # The SPA sets the bullet-separated title once the contest has loaded.
+        try:
+            self.page.wait_for_function(
+                "() => document.title.indexOf('\u2022') !== -1", timeout=15_000
+            )
+        except PlaywrightTimeoutError:
+            pass
         if self.sleep_s:
             time.sleep(self.sleep_s)
 
@@ -296,10 +427,167 @@ class PlaywrightClient(BasePlaywrightClient):
             raise RuntimeError("Browser not initialized. Use context manager (with statement).")
 
         url = f"{self.base_url}/contest/{election_id}"
+        cached = cache_get(url)
+        if cached is not None:
+            return cached
+
         self._navigate(url)
 
         self._wait_and_sleep(
             "#content table, table#contestCollectionTable, table.MuiTable-root"
         )
 
-        return self.page.content()
+        html_text = self.page.content()
+        # Cache only finished contests: a past year and a parsed results table
+        # (never a current-year count, error page or challenge interstitial).
+        title_year = re.match(r"\s*(\d{4})\b", self.page.title())
+        if (
+            title_year
+            and int(title_year.group(1)) < date.today().year
+            and _has_result_rows(html_text)
+        ):
+            cache_put(url, html_text)
+        return html_text
+
+    # ── Batch contest fetches ──────────────────────────────────────────────────
+
+    def _map_contests(
+        self, method: str, election_ids: List[int], concurrency: int
+    ) -> Dict[int, Union[object, Exception]]:
+        """Run ``self.<method>(election_id)`` for many contests on parallel browsers.
+
+        Playwright's sync API is bound to its owning thread, so the contests are
+        split round-robin over a long-lived executor (see
+        :func:`shutdown_browser_workers`) whose threads each keep their own
+        client on their thread's pooled browser.  This client's cookies (including any
+        Cloudflare clearance) are copied into the worker contexts first.
+        Per-contest failures are returned as the exception instead of aborting
+        the batch.
+        """
+        results: Dict[int, Union[object, Exception]] = {}
+        if not election_ids:
+            return results
+        concurrency = max(1, min(concurrency, len(election_ids)))
+        cookies = self.context.cookies() if self.context is not None else []
+        config = (self.state_key, self.base_url, self.headless, self.sleep_s)
+
+        shares = [election_ids[i::concurrency] for i in range(concurrency)]
+        executor = _batch_executor(concurrency)
+        futures = [
+            executor.submit(_run_share, config, cookies, method, ids) for ids in shares
+        ]
+        for future in futures:
+            results.update(future.result())
+        return results
+
+    def get_detail_pages(
+        self, election_ids: List[int], concurrency: int = 4
+    ) -> Dict[int, Union[str, Exception]]:
+        """Fetch many contest detail pages concurrently (see :meth:`get_detail_page`)."""
+        return self._map_contests("get_detail_page", election_ids, concurrency)
+
+    def fetch_contests_csv_and_type(
+        self, election_ids: List[int], concurrency: int = 4
+    ) -> Dict[int, Union[tuple, Exception]]:
+        """Batch form of :meth:`fetch_contest_csv_and_type` over parallel browsers."""
+        return self._map_contests("fetch_contest_csv_and_type", election_ids, concurrency)
+
+
+# ── Batch worker threads ───────────────────────────────────────────────────────
+#
+# Batches run on one long-lived executor.  Each of its threads keeps a
+# PlaywrightClient open on that thread's pooled browser between batches, so
+# each year reuses warm browsers instead of cold-launching Chromium (and
+# re-clearing Cloudflare) per worker.
+
+_BATCH_LOCAL = threading.local()
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_EXECUTOR_WORKERS = 0
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def _batch_client(
+    state_key: str, base_url: str, headless: bool, sleep_s: float
+) -> PlaywrightClient:
+    """This worker thread's long-lived client, reopened if the target site changes."""
+    key = (state_key, base_url, headless, sleep_s)
+    client = getattr(_BATCH_LOCAL, "client", None)
+    if client is None or _BATCH_LOCAL.key != key:
+        _close_batch_client()
+        client = PlaywrightClient(state_key, base_url, headless=headless, sleep_s=sleep_s)
+        client.__enter__()
+        _BATCH_LOCAL.client, _BATCH_LOCAL.key = client, key
+    return client
+
+
+def _close_batch_client() -> None:
+    client = getattr(_BATCH_LOCAL, "client", None)
+    _BATCH_LOCAL.client = None
+    if client is not None:
+        try:
+            client.__exit__(None, None, None)
+        except Exception:
+            pass
+
+
+def _run_share(
+    config: tuple, cookies: list, method: str, ids: List[int]
+) -> Dict[int, Union[object, Exception]]:
+    """Run ``<method>(election_id)`` for *ids* on this thread's batch client."""
+    try:
+        client = _batch_client(*config)
+        if cookies:
+            client.context.add_cookies(cookies)
+    except Exception as exc:
+        return {eid: exc for eid in ids}
+    results: Dict[int, Union[object, Exception]] = {}
+    for eid in ids:
+        try:
+            results[eid] = getattr(client, method)(eid)
+        except Exception as exc:
+            results[eid] = exc
+    return results
+
+
+def _release_thread(barrier: threading.Barrier) -> None:
+    # The barrier holds every worker until all have one of these jobs, so
+    # each thread closes its own client and browser exactly once.
+    barrier.wait()
+    _close_batch_client()
+    PLAYWRIGHT_POOL.close_thread()
+
+
+def _batch_executor(n: int) -> ThreadPoolExecutor:
+    """The shared batch executor, (re)started with at least *n* threads."""
+    global _EXECUTOR, _EXECUTOR_WORKERS
+    if _EXECUTOR is not None and _EXECUTOR_WORKERS >= n:
+        return _EXECUTOR
+    shutdown_browser_workers()
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ThreadPoolExecutor(
+                max_workers=n, thread_name_prefix="electionstats-browser"
+            )
+            _EXECUTOR_WORKERS = n
+        return _EXECUTOR
+
+
+def shutdown_browser_workers() -> None:
+    """Stop the batch worker threads and close their browsers.
+
+    Call once a scrape's years are all done; the next batch starts fresh
+    workers.  Also registered with ``atexit``.
+    """
+    global _EXECUTOR, _EXECUTOR_WORKERS
+    with _EXECUTOR_LOCK:
+        executor, n = _EXECUTOR, _EXECUTOR_WORKERS
+        _EXECUTOR, _EXECUTOR_WORKERS = None, 0
+    if executor is None:
+        return
+    barrier = threading.Barrier(n)
+    for _ in range(n):
+        executor.submit(_release_thread, barrier)
+    executor.shutdown(wait=True)
+
+
+atexit.register(shutdown_browser_workers)
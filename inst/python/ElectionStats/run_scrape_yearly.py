@@ -1,14 +1,19 @@
 # ElectionStats/run_scrape_yearly.py
 from __future__ import annotations
 
+import shutil
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import fields
+from datetime import date, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Callable
 
 import pandas as pd
 import pyreadr  
 
-from ElectionStats.electionStats_client import HttpConfig, StateHttpClient
+from ElectionStats.electionStats_client import HttpConfig, StateHttpClient, make_pooled_session
 from ElectionStats.electionStats_models import ElectionSearchRow
 from ElectionStats.electionStats_search import (
     fetch_all_search_results,
@@ -25,8 +30,10 @@ from ElectionStats.electionStats_precinct_search import (
     build_county_and_precinct_dataframe_parallel,
 )
 from ElectionStats.state_config import get_state_config
-from ElectionStats.playwright_client import PlaywrightClient
+from ElectionStats.playwright_client import PlaywrightClient, shutdown_browser_workers
+from playwright_base import PLAYWRIGHT_POOL
 from df_utils import concat_or_empty as _concat_or_empty
+from html_cache import set_cache_dir
 from column_schemas import ES_STATE_COLS, ES_COUNTY_COLS, finalize_df, compute_vote_pct
 
 
@@ -43,7 +50,16 @@ _TIMEOUT_S = 120
 _SLEEP_S_STATE = 0.10
 _SLEEP_S_COUNTY = 0.10
 _MAX_WORKERS = 6
+_PARALLEL_BUFFERSIZE = 2 * _MAX_WORKERS  # elections queued ahead of the county/precinct consumer
+_MAX_YEAR_WORKERS = 4  # years scraped concurrently (requests-based states only)
+_MAX_BROWSER_PAGES = 4  # parallel browser pages for Cloudflare-gated CSV downloads
+_HTTP_POOL_SIZE = _MAX_YEAR_WORKERS * _MAX_WORKERS  # one shared session serves all year x county workers
 _SAMPLE_N = 5000
+_CSV_CHUNK_ROWS = 100_000
+_RDS_SPLIT_ROWS = 2_000_000  # above this, RDS output is written per election_year
+_HTML_CACHE_DIR = ".html_cache"
+_HTML_CACHE_TTL = timedelta(days=7)  # archive pages rarely change; refetch weekly
+_HTML_CACHE_LIVE_TTL = timedelta(hours=1)  # runs reaching the current year: counts may still move
 
 JOIN_KEYS = ["state", "election_id", "candidate_id"]
 COUNTY_COLS = ES_COUNTY_COLS
@@ -59,14 +75,87 @@ def _ensure_outdir(outdir: str | Path) -> Path:
 
 
 def _save_rds(df: pd.DataFrame, path: Path) -> None:
-    pyreadr.write_rds(str(path), df, compress="gzip")
+    """Write *df* as gzipped RDS; very large frames are split into one file per year.
 
+    pyreadr converts the whole frame before compressing, so a single multi-
+    million-row RDS roughly doubles peak memory.  Per-year parts
+    (``<stem>_<year>.rds``) bound that to one year; ``rbind`` them in R.
+    """
+    if len(df) <= _RDS_SPLIT_ROWS or "election_year" not in df.columns:
+        pyreadr.write_rds(str(path), df, compress="gzip")
+        return
+    for year, part in df.groupby("election_year", sort=True):
+        part_path = path.with_name(f"{path.stem}_{year}{path.suffix}")
+        pyreadr.write_rds(str(part_path), part, compress="gzip")
+    print(f"[INFO] {len(df):,} rows; wrote per-year RDS parts next to {path}")
+
+
+def _write_csv(df: pd.DataFrame, path: Path) -> None:
+    """Write *df* with pyarrow's C++ CSV writer when available, else pandas."""
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+    except ImportError:
+        df.to_csv(path, index=False, chunksize=_CSV_CHUNK_ROWS)
+        return
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Mixed-type object column; pandas stringifies these itself.
+        df.to_csv(path, index=False, chunksize=_CSV_CHUNK_ROWS)
+        return
+    pa_csv.write_csv(table, path)
+
+
+def _arrow_strings(df: pd.DataFrame) -> pd.DataFrame:
+    """Cast object/string columns to Arrow-backed strings for Parquet."""
+    import pyarrow as pa
+
+    # Arrow-backed strings: compact on disk and zero-copy on read-back
+    str_cols = [c for c in df.columns if df[c].dtype == object or pd.api.types.is_string_dtype(df[c])]
+    # Going through "string" first stringifies mixed-type object columns
+    # (e.g. districts holding both ints and strs), which pyarrow would reject.
+    return df.astype({c: "string" for c in str_cols}).astype(
+        {c: pd.ArrowDtype(pa.string()) for c in str_cols}
+    )
 
-def _save_outputs(df: pd.DataFrame, outdir: Path, base_name: str, sample_n: int = _SAMPLE_N) -> None:
+
+def _save_parquet(df: pd.DataFrame, path: Path) -> None:
+    _arrow_strings(df).to_parquet(
+        path, engine="pyarrow", compression="zstd", compression_level=3, index=False
+    )
+
+
+def _save_outputs(
+    df: pd.DataFrame,
+    outdir: Path,
+    base_name: str,
+    sample_n: int = _SAMPLE_N,
+    write_rds: bool = False,
+) -> None:
+    """
+    Write a CSV sample plus the full frame as zstd Parquet (read it in R with
+    ``arrow::read_parquet``).  RDS is only written when *write_rds* is set or
+    as a fallback when pyarrow is missing: pyreadr's single-threaded gzip
+    writer dominates save time on multi-million-row outputs.
+    """
     outdir.mkdir(parents=True, exist_ok=True)
 
     sample_csv = outdir / f"{base_name}_sample.csv"
-    df.head(sample_n).to_csv(sample_csv, index=False)
+    _write_csv(df.head(sample_n), sample_csv)
+
+    parquet_path = outdir / f"{base_name}.parquet"
+    try:
+        _save_parquet(df, parquet_path)
+    except ImportError:
+        print(f"[WARN] pyarrow not installed; writing RDS instead of Parquet: {parquet_path}")
+        write_rds = True
+    except Exception as e:
+        print(f"[WARN] Failed to write Parquet {parquet_path}: {e}")
+        write_rds = True
+
+    if not write_rds:
+        return
 
     rds_path = outdir / f"{base_name}.rds"
     try:
@@ -85,16 +174,27 @@ def _normalize_state(state: str) -> str:
 
 
 def _make_client(state_key: str, base_url: str, sleep_s: float, search_path: str, url_style: str = "path_params") -> StateHttpClient:
+    # Positional call so keyword/positional callers hit the same cache entry.
+    return _cached_client(state_key, base_url, sleep_s, search_path, url_style)
+
+
+@lru_cache(maxsize=None)
+def _cached_client(state_key: str, base_url: str, sleep_s: float, search_path: str, url_style: str) -> StateHttpClient:
+    # Every year / county pass for the same site shares one client and its
+    # pooled keep-alive session instead of re-handshaking TLS.
     return StateHttpClient(
         state=state_key,
         base_url=base_url,
         config=HttpConfig(timeout_s=_TIMEOUT_S, sleep_s=sleep_s),
         search_path=search_path,
         url_style=url_style,
+        session=make_pooled_session(pool_size=_HTTP_POOL_SIZE),
     )
 
 
 def _make_client_factory(state_key: str, base_url: str, sleep_s: float, search_path: str, url_style: str = "path_params"):
+    # The shared client only holds config + a requests.Session, which is safe
+    # for concurrent simple GETs, so every worker thread gets the same one.
     def factory() -> StateHttpClient:
         return _make_client(state_key, base_url, sleep_s, search_path, url_style)
     return factory
@@ -104,6 +204,24 @@ def _make_client_factory(state_key: str, base_url: str, sleep_s: float, search_p
 # Scraping sub-routines
 # ---------------------------
 
+def _safe_merge(
+    left: pd.DataFrame,
+    right: pd.DataFrame,
+    on: str | list[str],
+    how: str = "left",
+    validate: str = "many_to_one",
+) -> pd.DataFrame:
+    """
+    ``left.merge(right, ...)`` with every parameter spelled out.
+
+    ``validate`` makes a duplicated key on the lookup side raise instead of
+    silently multiplying rows, and ``sort=False`` keeps *left*'s row order
+    without a sort pass.  (``copy=False`` is the default under pandas
+    Copy-on-Write and passing it is deprecated, so it is not forwarded.)
+    """
+    return left.merge(right, on=on, how=how, validate=validate, sort=False)
+
+
 def _rebuild_state_from_county_v2(
     county_df: pd.DataFrame,
     state_name: str,
@@ -135,7 +253,7 @@ def _rebuild_state_from_county_v2(
             .sum()
             .rename(columns={"votes": "total_votes"})
         )
-    statewide = statewide.merge(election_total, on="election_id", how="left")
+    statewide = _safe_merge(statewide, election_total, on="election_id")
     statewide = compute_vote_pct(statewide, ["election_id"], total_col="total_votes")
 
     max_votes = statewide.groupby("election_id")["votes"].transform("max")
@@ -152,6 +270,32 @@ def _rebuild_state_from_county_v2(
     return statewide
 
 
+def _with_state_year(df: pd.DataFrame, state_name: str, year: int) -> pd.DataFrame:
+    """Set ``state`` (and ``election_year`` if absent) in one ``assign``
+    rather than one column insert each."""
+    extra = {} if "election_year" in df.columns else {"election_year": year}
+    return df.assign(state=state_name, **extra)
+
+
+def _unique_elections(
+    state_name: str, election_ids: pd.Series, build_url: Callable[[int], str]
+) -> pd.DataFrame:
+    """One (state, election_id, url) row per election, in first-seen order.
+
+    ``state`` is constant per scrape and ``url`` is derived from
+    ``election_id``, so uniqueness over the integer id alone is equivalent to
+    ``drop_duplicates`` over all three columns.
+    """
+    ids = election_ids.unique()
+    return pd.DataFrame(
+        {
+            "state": state_name,
+            "election_id": ids,
+            "url": [build_url(eid) for eid in ids.tolist()],
+        }
+    )
+
+
 def _scrape_playwright_year(
     state_key: str,
     state_name: str,
@@ -173,11 +317,11 @@ def _scrape_playwright_year(
         if state_df.empty:
             return state_df, pd.DataFrame(columns=COUNTY_COLS), pd.DataFrame(columns=_PRECINCT_COLS)
 
-        state_df["state"] = state_name
-        if "election_year" not in state_df.columns:
-            state_df["election_year"] = year
+        state_df = _with_state_year(state_df, state_name, year)
 
-        unique_elections = state_df[["state", "election_id", "url"]].drop_duplicates()
+        unique_elections = _unique_elections(
+            state_name, state_df["election_id"], lambda eid: f"{pw_client.base_url}/contest/{eid}"
+        )
 
         if not need_subunit:
             county_df = pd.DataFrame(columns=COUNTY_COLS)
@@ -194,14 +338,15 @@ def _scrape_playwright_year(
                     url_style=url_style,
                 ),
                 max_workers=_MAX_WORKERS,
+                buffersize=_PARALLEL_BUFFERSIZE,
             )
         else:
             n_unique = len(unique_elections)
             # For states like NY whose CSV API is behind Cloudflare, route downloads
-            # through the already-open browser session (which has Cloudflare clearance).
-            # This also forces sequential execution (required for Playwright).
-            meta_fetcher = (
-                pw_client.fetch_contest_csv_and_type
+            # through browser sessions (which obtain Cloudflare clearance); the
+            # client spreads contests over a few parallel browser pages.
+            meta_batch_fetcher = (
+                (lambda ids: pw_client.fetch_contests_csv_and_type(ids, concurrency=_MAX_BROWSER_PAGES))
                 if state_cfg.get("csv_requires_browser", False)
                 else None
             )
@@ -209,7 +354,7 @@ def _scrape_playwright_year(
                 state_df=unique_elections,
                 base_url=base_url,
                 max_workers=_MAX_WORKERS,
-                meta_fetcher=meta_fetcher,
+                meta_batch_fetcher=meta_batch_fetcher,
             )
 
         if scraper_type == "v2" and not county_df.empty:
@@ -232,8 +377,10 @@ def _scrape_playwright_year(
                     or (state_df[col].isna() | state_df[col].astype(str).str.strip().eq("")).all()
                 )
                 if col_empty:
-                    state_df = state_df.drop(columns=[col], errors="ignore").merge(
-                        _search_meta[["election_id", col]], on="election_id", how="left"
+                    state_df = _safe_merge(
+                        state_df.drop(columns=[col], errors="ignore"),
+                        _search_meta[["election_id", col]],
+                        on="election_id",
                     )
 
     return state_df, county_df, precinct_df
@@ -270,9 +417,7 @@ def _scrape_classic_year(
     if state_df.empty:
         return state_df, pd.DataFrame(columns=COUNTY_COLS), pd.DataFrame(columns=_PRECINCT_COLS)
 
-    state_df["state"] = state_name
-    if "election_year" not in state_df.columns:
-        state_df["election_year"] = year
+    state_df = _with_state_year(state_df, state_name, year)
 
     if "vote_pct" in state_df.columns:
         state_df["vote_pct"] = (
@@ -282,7 +427,7 @@ def _scrape_classic_year(
         )
     state_df = compute_vote_pct(state_df, ["election_id"], fill_missing_only=True)
 
-    unique_elections = state_df[["state", "election_id", "url"]].drop_duplicates()
+    unique_elections = _unique_elections(state_name, state_df["election_id"], state_client.build_detail_url)
 
     if not need_subunit:
         county_df = pd.DataFrame(columns=COUNTY_COLS)
@@ -300,6 +445,7 @@ def _scrape_classic_year(
                     url_style=url_style,
                 ),
                 max_workers=_MAX_WORKERS,
+                buffersize=_PARALLEL_BUFFERSIZE,
             )
         else:
             county_client = _make_client(
@@ -326,9 +472,7 @@ def _postprocess_scrape_outputs(
     if county_df.empty:
         return state_df, pd.DataFrame(columns=COUNTY_COLS), precinct_df
 
-    county_df["state"] = state_name
-    if "election_year" not in county_df.columns:
-        county_df["election_year"] = year
+    county_df = _with_state_year(county_df, state_name, year)
 
     if "votes" in county_df.columns:
         max_votes = county_df.groupby(["election_id", "county_or_city"], dropna=False)["votes"].transform("max")
@@ -348,21 +492,22 @@ def _postprocess_scrape_outputs(
 
     if not state_df.empty:
         _url_cols = ["url"] if "url" in state_df.columns else []
-        _type_party = (
-            state_df[["election_id", "candidate_id", "election_type", "office", "office_level", "district", "party"] + _url_cols]
-            .drop_duplicates(subset=["election_id", "candidate_id"])
-        )
-        _year_type_party = (
-            state_df[["election_id", "candidate_id", "election_year", "election_type", "office", "office_level", "district", "party"] + _url_cols]
-            .drop_duplicates(subset=["election_id", "candidate_id"])
-        )
+        # One hash pass over the integer keys serves both lookups below
+        # (drop_duplicates(subset=...) keeps the same first occurrences).
+        _first = ~state_df.duplicated(subset=["election_id", "candidate_id"])
+        _type_party = state_df.loc[
+            _first, ["election_id", "candidate_id", "election_type", "office", "office_level", "district", "party"] + _url_cols
+        ]
+        _year_type_party = state_df.loc[
+            _first, ["election_id", "candidate_id", "election_year", "election_type", "office", "office_level", "district", "party"] + _url_cols
+        ]
         _join_keys = {"election_id", "candidate_id"}
         if not county_df.empty:
             _overlap = [c for c in _type_party.columns if c not in _join_keys and c in county_df.columns]
-            county_df = county_df.drop(columns=_overlap).merge(_type_party, on=["election_id", "candidate_id"], how="left")
+            county_df = _safe_merge(county_df.drop(columns=_overlap), _type_party, on=["election_id", "candidate_id"])
         if not precinct_df.empty:
             _overlap = [c for c in _year_type_party.columns if c not in _join_keys and c in precinct_df.columns]
-            precinct_df = precinct_df.drop(columns=_overlap).merge(_year_type_party, on=["election_id", "candidate_id"], how="left")
+            precinct_df = _safe_merge(precinct_df.drop(columns=_overlap), _year_type_party, on=["election_id", "candidate_id"])
 
     state_df = finalize_df(state_df, ES_STATE_COLS)
     county_df = finalize_df(county_df, COUNTY_COLS)
@@ -466,14 +611,56 @@ def _join_county_with_state(county_all: pd.DataFrame, state_all: pd.DataFrame) -
     # One statewide row per (state, election_id, candidate_id)
     state_subset = state_all.drop_duplicates(subset=JOIN_KEYS)
 
-    # Merge: many county rows to one statewide row
-    joined = county_all.merge(
-        state_subset,
-        on=JOIN_KEYS,
-        how="left",
-        validate="many_to_one",
+    # A scrape covers one state, so `state` is a single repeated string on
+    # both sides; join on the integer keys alone instead of hashing it per row.
+    join_keys = JOIN_KEYS
+    county_states = county_all["state"].unique()
+    if len(county_states) == 1 and state_subset["state"].eq(county_states[0]).all():
+        join_keys = [k for k in JOIN_KEYS if k != "state"]
+        state_subset = state_subset.drop(columns="state")
+
+    # Many county rows to one statewide row.  Validate on the keys actually
+    # joined, since `state` may have been dropped from them above.
+    return county_all.merge(
+        state_subset, on=join_keys, how="left", sort=False, validate="many_to_one"
     )
-    return joined
+
+
+# ---------------------------
+# Per-year staging
+# ---------------------------
+def _staging_dir(outdir: Path) -> Path | None:
+    """Directory for per-year Parquet spills, or None if pyarrow is missing."""
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        print("[WARN] pyarrow not installed; keeping per-year frames in memory")
+        return None
+    staging = outdir / "_staging"
+    staging.mkdir(parents=True, exist_ok=True)
+    return staging
+
+
+def _stage_year(df: pd.DataFrame, staging_dir: Path | None, kind: str, year: int):
+    """Spill one finished year to ``<staging>/<kind>_year=<year>.parquet`` and
+    return the path; without a staging dir the frame itself is kept."""
+    if staging_dir is None:
+        return df
+    path = staging_dir / f"{kind}_year={year}.parquet"
+    _arrow_strings(df).to_parquet(path, engine="pyarrow", index=False)
+    return path
+
+
+def _load_staged(parts: list) -> list[pd.DataFrame]:
+    """Read staged years back, deleting each spill file once it is loaded."""
+    frames = []
+    for p in parts:
+        if isinstance(p, Path):
+            frames.append(pd.read_parquet(p, engine="pyarrow"))
+            p.unlink(missing_ok=True)
+        else:
+            frames.append(p)
+    return frames
 
 
 # ---------------------------
@@ -487,8 +674,19 @@ def main() -> None:
     year_from = 2024
     year_to = 2024
     parallel = True
+    use_cache = True  # False = always re-download (no on-disk page cache)
+    # Spill each finished year to Parquet while scraping (needs pyarrow).  Only
+    # bounds memory during the scrape: the final concat still loads every year.
+    stage_years = False
+    write_rds = False  # True = also write .rds next to the .parquet outputs
     # -------------------------
 
+    if use_cache:
+        live = year_to >= date.today().year
+        set_cache_dir(
+            _HTML_CACHE_DIR, expire_after=_HTML_CACHE_LIVE_TTL if live else _HTML_CACHE_TTL
+        )
+
     state_key = _normalize_state(state)
 
     # Get state configuration from state_config.py
@@ -505,13 +703,18 @@ def main() -> None:
 
     out = _ensure_outdir(f"{state_key}_outputs")
 
-    state_frames: list[pd.DataFrame] = []
-    county_frames: list[pd.DataFrame] = []
+    state_frames: list = []
+    county_frames: list = []
+    staging_dir = _staging_dir(out) if stage_years else None
 
-    for year in range(year_from, year_to + 1):
-        print(f"\n=== Scraping {state_key} year {year} ===")
+    # Each year is an independent, network-bound job.  Playwright browsers are
+    # not thread-safe, so those states keep a single (serial) worker.
+    years = list(range(year_from, year_to + 1))
+    year_workers = 1 if scraping_method == "playwright" else min(_MAX_YEAR_WORKERS, len(years))
+    print(f"\n=== Scraping {state_key} {year_from}–{year_to} ({year_workers} worker(s)) ===")
 
-        state_df, county_df, precinct_df = scrape_one_year(
+    def _scrape_year(year: int):
+        return scrape_one_year(
             state_key=state_key,
             state_name=state,
             base_url=base_url,
@@ -522,33 +725,64 @@ def main() -> None:
             url_style=url_style,
         )
 
-        print(f"[{year}] state rows:  {len(state_df):,}")
-        print(f"[{year}] county rows: {len(county_df):,}")
-
-        if not state_df.empty:
-            state_frames.append(state_df)
-
-        if not county_df.empty:
-            county_frames.append(county_df)
+    if year_workers == 1:
+        # Serial years run on this thread so every year reuses the pooled
+        # browser, which is started up front rather than inside year one.
+        if scraping_method == "playwright":
+            PLAYWRIGHT_POOL.warm()
+        year_results = map(_scrape_year, years)
+        ex = None
+    else:
+        # map() yields in year order, so outputs don't depend on completion
+        # order; buffersize (3.14+) bounds how many finished years sit in memory.
+        map_kwargs = {"buffersize": year_workers} if sys.version_info >= (3, 14) else {}
+        ex = ThreadPoolExecutor(max_workers=year_workers)
+        year_results = ex.map(_scrape_year, years, **map_kwargs)
 
-    state_all = _concat_or_empty(state_frames)
-    county_all = _concat_or_empty(county_frames)
+    try:
+        for year, (state_df, county_df, _precinct_df) in zip(years, year_results):
+            print(f"[{year}] state rows:  {len(state_df):,}")
+            print(f"[{year}] county rows: {len(county_df):,}")
+
+            if not state_df.empty:
+                state_frames.append(_stage_year(state_df, staging_dir, "state", year))
+
+            if not county_df.empty:
+                county_frames.append(_stage_year(county_df, staging_dir, "county", year))
+            del state_df, county_df, _precinct_df
+
+        state_all = _concat_or_empty(_load_staged(state_frames))
+        county_all = _concat_or_empty(_load_staged(county_frames))
+    finally:
+        if ex is not None:
+            ex.shutdown(cancel_futures=True)
+        # Browsers are kept across years; release them with the run.
+        shutdown_browser_workers()
+        PLAYWRIGHT_POOL.close_thread()
+        if staging_dir is not None:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+    # The per-year frames are fully copied into the concatenated results;
+    # drop them now so they aren't held through the join and the writes.
+    state_frames.clear()
+    county_frames.clear()
 
     if not state_all.empty:
         _save_outputs(
             state_all,
             out,
             base_name=f"{state_key}_state_{year_from}_{year_to}",
+            write_rds=write_rds,
         )
-        print(f"[OK] Saved state sample+RDS to {out}")
+        print(f"[OK] Saved state outputs to {out}")
 
     if not county_all.empty:
         _save_outputs(
             county_all,
             out,
             base_name=f"{state_key}_county_{year_from}_{year_to}",
+            write_rds=write_rds,
         )
-        print(f"[OK] Saved county sample+RDS to {out}")
+        print(f"[OK] Saved county outputs to {out}")
 
     joined_df = _join_county_with_state(
         county_all=county_all,
@@ -560,8 +794,9 @@ def main() -> None:
             joined_df,
             out,
             base_name=f"{state_key}_joined_{year_from}_{year_to}",
+            write_rds=write_rds,
         )
-        print(f"[OK] Saved joined sample+RDS to {out}")
+        print(f"[OK] Saved joined outputs to {out}")
 
     print("\n✅ Done.")
 
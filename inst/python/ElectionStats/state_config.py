@@ -4,6 +4,7 @@ State configuration registry for ElectionStats scrapers.
 Defines scraper types, scraping methods, and URL configurations for all supported states.
 """
 
+from functools import lru_cache
 from typing import Literal, TypedDict
 
 ScraperType = Literal["classic", "v2"]
@@ -101,6 +102,12 @@ STATE_CONFIGS: dict[str, StateConfig] = {
 }
 
 
+@lru_cache(maxsize=256)
+def _normalize_state_key(state_key: str) -> str:
+    """'South Carolina ' -> 'south_carolina'; cached since callers repeat a few keys."""
+    return state_key.strip().lower().replace(" ", "_")
+
+
 def get_scraper_type(state_key: str) -> ScraperType:
     """Get the scraper type ('classic' or 'v2') for a given state.
 
@@ -119,16 +126,20 @@ def get_scraper_type(state_key: str) -> ScraperType:
     ValueError
         If state_key is not recognized
     """
-    state_key = state_key.strip().lower().replace(" ", "_")
+    state_key = _normalize_state_key(state_key)
     config = STATE_CONFIGS.get(state_key)
     if not config:
         raise ValueError(f"Unknown state: {state_key}")
     return config["scraper_type"]
 
 
+@lru_cache(maxsize=None)
 def get_state_config(state_key: str) -> StateConfig:
     """Get full configuration for a state.
 
+    Results are cached per spelling of *state_key*; the returned dict is the
+    registry entry itself, as before caching.
+
     Parameters
     ----------
     state_key : str
@@ -144,7 +155,7 @@ def get_state_config(state_key: str) -> StateConfig:
     ValueError
         If state_key is not recognized
     """
-    state_key = state_key.strip().lower().replace(" ", "_")
+    state_key = _normalize_state_key(state_key)
     if state_key not in STATE_CONFIGS:
         raise ValueError(
             f"Unknown state: {state_key}. Available: {sorted(STATE_CONFIGS.keys())}"
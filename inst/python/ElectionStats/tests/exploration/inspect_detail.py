@@ -1,7 +1,12 @@
 """Inspect detail page structure."""
 
 from pathlib import Path
-from lxml import html
+from lxml import etree, html
+
+# Compiled once; these run for every table / row / cell below.
+_XP_TABLES = etree.XPath("//table")
+_XP_ROWS = etree.XPath(".//tr")
+_XP_CELLS = etree.XPath("./th|./td")
 
 # Read from tests/output directory
 output_dir = Path(__file__).parent.parent / "output"
@@ -18,7 +23,7 @@ with open(html_file, "r") as f:
 doc = html.fromstring(content)
 
 # Find all tables
-tables = doc.xpath("//table")
+tables = _XP_TABLES(doc)
 print(f"Found {len(tables)} tables\n")
 
 for i, table in enumerate(tables):
@@ -26,15 +31,15 @@ for i, table in enumerate(tables):
     print(f"  ID: {table.get('id')}")
     print(f"  Class: {table.get('class')}")
 
-    rows = table.xpath(".//tr")
+    rows = _XP_ROWS(table)
     print(f"  Rows: {len(rows)}")
 
     if rows:
         # Look at first few rows
         for j, row in enumerate(rows[:3]):
-            cells = row.xpath("./th|./td")
+            cells = _XP_CELLS(row)
             if cells:
-                cell_text = [' '.join(cell.xpath('.//text()')).strip()[:50] for cell in cells]
+                cell_text = [cell.text_content().strip()[:50] for cell in cells]
                 print(f"    Row {j+1} cells: {cell_text}")
 
     print()
@@ -1,7 +1,13 @@
 """Quick script to inspect rendered HTML structure."""
 
 from pathlib import Path
-from lxml import html
+from lxml import etree, html
+
+# Compiled once; the per-table expressions run inside the loop below.
+_XP_TABLES = etree.XPath("//table")
+_XP_ROWS = etree.XPath(".//tr")
+_XP_CELLS = etree.XPath("./th|./td")
+_XP_ID_ELEMENTS = etree.XPath("//*[starts-with(@id, 'election-') or starts-with(@id, 'contest-')]")
 
 # Read from tests/output directory
 output_dir = Path(__file__).parent.parent / "output"
@@ -18,7 +24,7 @@ with open(html_file, "r") as f:
 doc = html.fromstring(content)
 
 # Try to find tables
-tables = doc.xpath("//table")
+tables = _XP_TABLES(doc)
 print(f"Found {len(tables)} tables")
 
 for i, table in enumerate(tables[:5]):  # First 5 tables
@@ -27,7 +33,7 @@ for i, table in enumerate(tables[:5]):  # First 5 tables
     print(f"  Class: {table.get('class')}")
 
     # Find rows
-    rows = table.xpath(".//tr")
+    rows = _XP_ROWS(table)
     print(f"  Rows: {len(rows)}")
 
     if len(rows) > 0:
@@ -36,15 +42,15 @@ for i, table in enumerate(tables[:5]):  # First 5 tables
         print(f"  First row ID: {first_row.get('id')}")
         print(f"  First row class: {first_row.get('class')}")
 
-        cells = first_row.xpath("./th|./td")
+        cells = _XP_CELLS(first_row)
         print(f"  First row cells: {len(cells)}")
 
         if cells:
-            print(f"  First cell text: {' '.join(cells[0].xpath('.//text()'))[:100]}")
+            print(f"  First cell text: {cells[0].text_content().strip()[:100]}")
 
 # Look for specific patterns
 print("\n\n=== Looking for election/contest IDs ===")
-elements_with_id = doc.xpath("//*[starts-with(@id, 'election-') or starts-with(@id, 'contest-')]")
+elements_with_id = _XP_ID_ELEMENTS(doc)
 print(f"Found {len(elements_with_id)} elements with election-/contest- IDs")
 for elem in elements_with_id[:5]:
     print(f"  {elem.tag}: id={elem.get('id')}, class={elem.get('class')}")
@@ -1,6 +1,12 @@
 """Inspect the actual data rows in detail."""
 
-from lxml import html
+from lxml import etree, html
+
+# Compiled once; the per-cell expressions run inside the loop below.
+_XP_CONTEST_TABLE = etree.XPath("//table[@id='contestCollectionTable']")
+_XP_ROWS = etree.XPath(".//tbody/tr")
+_XP_CELLS = etree.XPath("./td")
+_XP_HREFS = etree.XPath(".//a/@href")
 
 with open("../sc_rendered_2024.html", "r") as f:
     content = f.read()
@@ -8,8 +14,8 @@ with open("../sc_rendered_2024.html", "r") as f:
 doc = html.fromstring(content)
 
 # Get the contest table
-table = doc.xpath("//table[@id='contestCollectionTable']")[0]
-rows = table.xpath(".//tbody/tr")
+table = _XP_CONTEST_TABLE(doc)[0]
+rows = _XP_ROWS(table)
 
 print(f"Data rows: {len(rows)}\n")
 
@@ -20,18 +26,18 @@ for i, row in enumerate(rows[:2]):
     print(f"Class: {row.get('class')}")
 
     # Get all cells
-    cells = row.xpath("./td")
+    cells = _XP_CELLS(row)
     print(f"Cells: {len(cells)}\n")
 
     for j, cell in enumerate(cells):
-        text = ' '.join(cell.xpath('.//text()')).strip()
+        text = cell.text_content().strip()
         # Truncate if too long
         if len(text) > 150:
             text = text[:150] + "..."
         print(f"Cell {j+1}: {text}")
 
         # Check for links
-        links = cell.xpath(".//a/@href")
+        links = _XP_HREFS(cell)
         if links:
             print(f"  -> Link: {links[0]}")
 
@@ -16,7 +16,10 @@ Run:
 
 from __future__ import annotations
 
+import io
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Tuple
 
 from ElectionStats.electionStats_client import HttpConfig, StateHttpClient
@@ -96,23 +99,64 @@ def smoke_nc() -> None:
 # Runner
 # ---------------------------------------------------------------------------
 
+class _PerThreadStdout(io.TextIOBase):
+    """``sys.stdout`` stand-in that buffers each worker thread's prints separately."""
+
+    def __init__(self, real):
+        self._real = real
+        self._local = threading.local()
+
+    def capture(self) -> io.StringIO:
+        self._local.buf = io.StringIO()
+        return self._local.buf
+
+    def write(self, s: str) -> int:
+        buf = getattr(self._local, "buf", None)
+        return (buf or self._real).write(s)
+
+    def flush(self) -> None:
+        self._real.flush()
+
+
 def _run_states(
     states: List[str],
     label: str,
     smoke_fn,
+    max_workers: int = 8,
 ) -> Tuple[List[str], List[str]]:
-    """Run smoke_fn for each state; return (passed, failed) lists."""
-    passed, failed = [], []
+    """
+    Run smoke_fn for each state; return (passed, failed) lists.
+
+    Each state hits its own host, so the checks run concurrently; every
+    state's output is buffered and printed as one block, in sorted order.
+    """
     sep = "=" * 60
     print(f"\n{sep}\n{label} ({TEST_YEAR})\n{sep}")
-    for state in sorted(states):
-        print(f"\n[{state}]")
+
+    out = _PerThreadStdout(sys.stdout)
+
+    def _one(state: str) -> Tuple[bool, str]:
+        buf = out.capture()
         try:
             smoke_fn(state)
-            passed.append(state)
+            return True, buf.getvalue()
         except Exception as exc:
             print(f"  ✗ FAILED: {exc}")
-            failed.append(state)
+            return False, buf.getvalue()
+
+    ordered = sorted(states)
+    real_stdout, sys.stdout = sys.stdout, out
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(ordered)))) as ex:
+            results = list(ex.map(_one, ordered))
+    finally:
+        sys.stdout = real_stdout
+
+    passed, failed = [], []
+    for state, (ok, text) in zip(ordered, results):
+        print(f"\n[{state}]")
+        print(text, end="")
+        (passed if ok else failed).append(state)
     return passed, failed
 
 
@@ -133,7 +177,8 @@ def main(run_classic: bool = True, run_v2: bool = True, run_nc: bool = True) ->
         all_failed.extend(f)
 
     if run_v2:
-        p, f = _run_states(v2_states, "V2 states (playwright)", smoke_v2_state)
+        # One at a time: consecutive states reuse this thread's warm browser.
+        p, f = _run_states(v2_states, "V2 states (playwright)", smoke_v2_state, max_workers=1)
         all_passed.extend(p)
         all_failed.extend(f)
 
@@ -9,15 +9,10 @@ OUTPUT_DIR.mkdir(exist_ok=True)
 
 print("Fetching SC contest detail page (election_id=8119)...")
 with PlaywrightClient("south_carolina", "https://electionhistory.scvotes.gov") as client:
-    # Navigate to detail page (URL pattern is /contest/ID not /view/ID)
-    url = f"{client.base_url}/contest/8119"
-    client.page.goto(url, wait_until="networkidle")
-
-    # Wait a bit for any JS to load
-    import time
-    time.sleep(2)
-
-    html = client.page.content()
+    # get_detail_page uses the /contest/ID URL pattern (not /view/ID), navigates
+    # on domcontentloaded and waits for the results table itself instead of
+    # networkidle + a fixed sleep; images/fonts/CSS are blocked by the client.
+    html = client.get_detail_page(8119)
 
     output_file = OUTPUT_DIR / "sc_detail_8119.html"
     with open(output_file, "w", encoding="utf-8") as f:
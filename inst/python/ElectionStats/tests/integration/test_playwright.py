@@ -5,7 +5,6 @@ Run this to understand the rendered DOM structure before implementing v2 parsers
 """
 
 from pathlib import Path
-from ElectionStats.playwright_client import PlaywrightClient
 
 # Output directory for saved HTML files
 OUTPUT_DIR = Path(__file__).parent.parent / "output"
@@ -14,6 +13,8 @@ OUTPUT_DIR.mkdir(exist_ok=True)
 
 def test_south_carolina():
     """Render SC search page and save HTML."""
+    from ElectionStats.playwright_client import PlaywrightClient
+
     print("Fetching South Carolina 2024 elections...")
     with PlaywrightClient("south_carolina", "https://electionhistory.scvotes.gov") as client:
         html = client.get_search_page(2024, 2024)
@@ -28,6 +29,8 @@ def test_south_carolina():
 
 def test_new_mexico():
     """Render NM search page and save HTML."""
+    from ElectionStats.playwright_client import PlaywrightClient
+
     print("\nFetching New Mexico 2024 elections...")
     with PlaywrightClient("new_mexico", "https://electionstats.sos.nm.gov") as client:
         html = client.get_search_page(2024, 2024)
@@ -2,7 +2,6 @@
 
 from pathlib import Path
 from ElectionStats.electionStats_search import parse_search_results, fetch_all_search_results_v2
-from ElectionStats.playwright_client import PlaywrightClient
 from ElectionStats.state_config import get_state_config
 
 # Mock client for parse_search_results
@@ -46,8 +45,25 @@ print("\n" + "=" * 60)
 print("Testing live fetch with Playwright...")
 print("=" * 60)
 
+def _is_json_xhr(response) -> bool:
+    """XHR/fetch responses that carry JSON (candidate data APIs behind the React table)."""
+    return (
+        response.request.resource_type in ("xhr", "fetch")
+        and "json" in (response.headers.get("content-type") or "")
+    )
+
+
 try:
+    # Imported here so the saved-HTML check above runs without Playwright
+    from ElectionStats.playwright_client import PlaywrightClient
+
     with PlaywrightClient("south_carolina", "https://electionhistory.scvotes.gov") as client:
+        # Record JSON XHRs fired while the search table renders.  If the rows
+        # arrive as JSON, parsing that payload would skip the DOM entirely;
+        # dump what is seen so the endpoint and schema can be checked first.
+        json_responses = []
+        client.page.on("response", lambda r: json_responses.append(r) if _is_json_xhr(r) else None)
+
         live_rows = fetch_all_search_results_v2(client, 2024, 2024, "south_carolina")
         print(f"\n✓ Fetched {len(live_rows)} results live\n")
 
@@ -56,6 +72,18 @@ try:
             r = live_rows[0]
             print(f"  {r.candidate} - {r.office} ({r.contest_outcome})")
 
+        print(f"\nJSON XHR responses during render: {len(json_responses)}")
+        for i, resp in enumerate(json_responses):
+            print(f"  [{resp.status}] {resp.url}")
+            try:
+                body = resp.text()
+            except Exception as exc:  # body already evicted / redirect
+                print(f"      (body unavailable: {exc})")
+                continue
+            out = OUTPUT_DIR / f"sc_search_xhr_{i}.json"
+            out.write_text(body, encoding="utf-8")
+            print(f"      {len(body):,} chars -> {out.name}")
+
 except Exception as e:
     print(f"\n✗ Live fetch failed: {e}")
     import traceback
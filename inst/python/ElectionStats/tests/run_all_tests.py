@@ -1,21 +1,17 @@
 """Run all ElectionStats integration tests."""
 
+import contextlib
+import io
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-print("\n" + "=" * 70)
-print("ElectionStats Test Suite")
-print("=" * 70)
-
-# Import and run test modules
-test_results = {}
-
 
 def run_test_module(module_name, display_name):
-    """Run a test module and capture results."""
+    """Run a test module and return its result string."""
     print(f"\n{'=' * 70}")
     print(f"Running: {display_name}")
     print("=" * 70)
@@ -42,38 +38,76 @@ def run_test_module(module_name, display_name):
             from ElectionStats.tests.integration import test_playwright
             test_playwright.test_south_carolina()
 
-        test_results[display_name] = "✓ PASSED"
         print(f"\n✓ {display_name} PASSED")
+        return "✓ PASSED"
 
     except Exception as e:
-        test_results[display_name] = f"✗ FAILED: {str(e)[:50]}"
         print(f"\n✗ {display_name} FAILED: {e}")
         import traceback
         traceback.print_exc()
+        return f"✗ FAILED: {str(e)[:50]}"
+
+
+# Groups run in parallel worker processes; modules within a group run in
+# order.  The browser tests share a group: v2_parser reads the HTML that the
+# playwright test saves, and both reuse that process's Chromium.
+TEST_GROUPS = [
+    [("classic_parser", "Classic State Parsers (VA/MA/CO)")],
+    [("classic_fetch", "Classic State Fetching (VA/MA/CO)")],
+    [("playwright", "Playwright Client (SC)"), ("v2_parser", "V2 Parser (SC/NM)")],
+]
+
+
+def run_test_group(group):
+    """Run one group with its output buffered; return (results, output)."""
+    buf = io.StringIO()
+    results = []
+    with contextlib.redirect_stdout(buf), contextlib.redirect_stderr(buf):
+        if any(module_name in ("playwright", "v2_parser") for module_name, _ in group):
+            # Launch this process's shared browser once (playwright_base.PLAYWRIGHT_POOL).
+            try:
+                from playwright_base import PLAYWRIGHT_POOL
+                PLAYWRIGHT_POOL.warm()
+            except Exception as e:
+                print(f"[WARN] Could not pre-launch the shared browser: {e}")
+        for module_name, display_name in group:
+            results.append((display_name, run_test_module(module_name, display_name)))
+    return results, buf.getvalue()
+
+
+def main():
+    print("\n" + "=" * 70)
+    print("ElectionStats Test Suite")
+    print("=" * 70)
 
+    print("\nRunning integration tests (this may take a few minutes)...")
+    print("These tests hit live election websites with small samples.\n")
 
-# Run all tests
-print("\nRunning integration tests (this may take a few minutes)...")
-print("These tests hit live election websites with small samples.\n")
+    # The groups are independent and network-bound, so overlap them; each
+    # group's log is printed as one block, in the order listed above.
+    test_results = {}
+    with ProcessPoolExecutor(max_workers=len(TEST_GROUPS)) as ex:
+        for results, output in ex.map(run_test_group, TEST_GROUPS):
+            print(output, end="")
+            test_results.update(results)
+
+    # Print summary
+    print("\n" + "=" * 70)
+    print("Test Summary")
+    print("=" * 70)
 
-run_test_module("classic_parser", "Classic State Parsers (VA/MA/CO)")
-run_test_module("classic_fetch", "Classic State Fetching (VA/MA/CO)")
-run_test_module("playwright", "Playwright Client (SC)")
-run_test_module("v2_parser", "V2 Parser (SC/NM)")
+    for test_name, result in test_results.items():
+        print(f"{result:15} {test_name}")
 
-# Print summary
-print("\n" + "=" * 70)
-print("Test Summary")
-print("=" * 70)
+    passed = sum(1 for r in test_results.values() if "PASSED" in r)
+    total = len(test_results)
 
-for test_name, result in test_results.items():
-    print(f"{result:15} {test_name}")
+    print("\n" + "=" * 70)
+    print(f"Results: {passed}/{total} tests passed")
+    print("=" * 70 + "\n")
 
-passed = sum(1 for r in test_results.values() if "PASSED" in r)
-total = len(test_results)
+    sys.exit(0 if passed == total else 1)
 
-print("\n" + "=" * 70)
-print(f"Results: {passed}/{total} tests passed")
-print("=" * 70 + "\n")
 
-sys.exit(0 if passed == total else 1)
+if __name__ == "__main__":
+    main()
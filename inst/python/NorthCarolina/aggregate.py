@@ -34,19 +34,20 @@ def aggregate_county_to_state(df_county: pd.DataFrame) -> pd.DataFrame:
             f"Columns={list(df_county.columns)}"
         )
 
-    work = drop_writeins(df_county.copy())
-
-    # Ensure vote columns are numeric integers
-    work[vote_cols] = (
-        work[vote_cols]
-        .apply(pd.to_numeric, errors="coerce")
-        .fillna(0)
-        .astype("Int64")
-    )
+    # Only the key and vote columns are carried into the groupby; selecting
+    # them is a lazy (Copy-on-Write) view, so the wide input is never copied.
+    work = drop_writeins(df_county[required])
+
+    # Ensure vote columns are numeric integers (plain int64: no nulls survive
+    # the fillna, so the masked Int64 kernels would only add overhead)
+    work = work.assign(**{
+        c: pd.to_numeric(work[c], errors="coerce").fillna(0).astype("int64")
+        for c in vote_cols
+    })
 
     # 1) Roll up county -> state totals
     out = (
-        work.groupby(group_cols, dropna=False, as_index=False)[vote_cols]
+        work.groupby(group_cols, dropna=False, as_index=False, sort=False)[vote_cols]
         .sum()
     )
 
@@ -54,11 +55,14 @@ def aggregate_county_to_state(df_county: pd.DataFrame) -> pd.DataFrame:
     # are per-contest attributes carried through for groupby correctness.
     contest_cols = ["state", "election_date", "contest_name", "jurisdiction", "office_level", "district"]
 
+    # Hash the contest keys once; both the share and the winner reuse the ids.
+    contest_ids = out.groupby(contest_cols, dropna=False, sort=False).ngroup()
+
     # 2) Vote share within contest
-    out = compute_vote_pct(out, contest_cols)
+    out = compute_vote_pct(out, contest_cols, group_ids=contest_ids)
 
     # 3) Boolean winner: True for highest-voted candidate(s) per contest (ties share True)
-    max_votes = out.groupby(contest_cols, dropna=False)["votes"].transform("max")
+    max_votes = out["votes"].groupby(contest_ids).transform("max")
     out["winner"] = out["votes"].eq(max_votes)
 
     return out
@@ -96,19 +100,19 @@ def aggregate_to_county_level(df: pd.DataFrame) -> pd.DataFrame:
             f"Columns={list(df.columns)}"
         )
 
-    work = drop_writeins(df.copy(), candidate_col="choice")
+    # Thin key + vote frame only (lazy under Copy-on-Write); see above.
+    work = drop_writeins(df[required], candidate_col="choice")
 
-    # Ensure vote columns are numeric integers
-    work[vote_cols] = (
-        work[vote_cols]
-        .apply(pd.to_numeric, errors="coerce")
-        .fillna(0)
-        .astype("Int64")
-    )
+    # Ensure vote columns are numeric integers (plain int64: no nulls survive
+    # the fillna, so the masked Int64 kernels would only add overhead)
+    work = work.assign(**{
+        c: pd.to_numeric(work[c], errors="coerce").fillna(0).astype("int64")
+        for c in vote_cols
+    })
 
     out = (
         work
-        .groupby(group_cols, dropna=False, as_index=False)[vote_cols]
+        .groupby(group_cols, dropna=False, as_index=False, sort=False)[vote_cols]
         .sum()
     )
 
@@ -120,8 +124,9 @@ def aggregate_to_county_level(df: pd.DataFrame) -> pd.DataFrame:
     })
 
     contest_cols = ["state", "election_date", "county", "contest_name", "jurisdiction", "office_level", "district"]
-    out = compute_vote_pct(out, contest_cols)
-    max_votes = out.groupby(contest_cols, dropna=False)["votes"].transform("max")
+    contest_ids = out.groupby(contest_cols, dropna=False, sort=False).ngroup()
+    out = compute_vote_pct(out, contest_cols, group_ids=contest_ids)
+    max_votes = out["votes"].groupby(contest_ids).transform("max")
     out["county_winner"] = out["votes"].eq(max_votes)
 
     return out
@@ -1,6 +1,8 @@
+import numpy as np
 import pandas as pd
 
 import re
+from functools import lru_cache
 
 _CONTEST_RE = re.compile(
     r"""
@@ -96,11 +98,15 @@ _CONTEST_RE2 = re.compile(
 
     # Optional jurisdiction/entity prefix (counties, school systems, districts, etc.)
     (?:
+        # Name words scanned once, then the entity suffix
         (?P<jurisdiction>
-            [A-Z0-9&\.\-]+(?:\s+[A-Z0-9&\.\-]+)*\s+COUNTY(?:\s+PUBLIC\s+SCHOOLS)?|
-            [A-Z0-9&\.\-]+(?:\s+[A-Z0-9&\.\-]+)*\s+CITY\s+SCHOOLS|
-            [A-Z0-9&\.\-]+(?:\s+[A-Z0-9&\.\-]+)*\s+SANITARY\s+DISTRICT|
-            [A-Z0-9&\.\-]+(?:\s+[A-Z0-9&\.\-]+)*\s+SOIL\s+AND\s+WATER\s+CONSERVATION\s+DISTRICT
+            [A-Z0-9&\.\-]+(?:\s+[A-Z0-9&\.\-]+)*\s+
+            (?:
+                COUNTY(?:\s+PUBLIC\s+SCHOOLS)?|
+                CITY\s+SCHOOLS|
+                SANITARY\s+DISTRICT|
+                SOIL\s+AND\s+WATER\s+CONSERVATION\s+DISTRICT
+            )
         )
         \s+
     )?
@@ -185,18 +191,30 @@ _CONTEST_RE2 = re.compile(
 )
 
 
+# Every office alternative in _CONTEST_RE / _CONTEST_RE2 contains one of these
+# words, so names without any of them (referenda, bonds, ...) can't match.
+_OFFICE_KEYWORDS = (
+    "MAYOR", "COUNCIL", "BOARD", "COMMISSIONER", "TRUSTEE", "ALDERM",
+    "HOUSE", "SENATE", "PRESIDENT", "ATTORNEY", "AUDITOR", "GOVERNOR",
+    "SECRETARY", "TREASURER", "SUPERINTENDENT", "COURT", "SHERIFF",
+    "REGISTER", "SUPERVISOR",
+)
 
+_WS_RE = re.compile(r"\s+")
 
 
+# Contest names repeat on every precinct x candidate row; parse each once.
+@lru_cache(maxsize=16384)
 def extract_jurisdiction_office_and_district(contest_name: str):
     if not isinstance(contest_name, str):
         return None, None, None
 
     # --- normalize input ---
-    s = contest_name.upper().strip()
-    s = re.sub(r"^[,\s]+", "", s)
-    s = re.sub(r"[,\s]+$", "", s)
-    s = re.sub(r"\s+", " ", s)
+    # Collapse whitespace first; trimming ", " then equals stripping [,\s]+.
+    s = _WS_RE.sub(" ", contest_name.upper()).strip(" ,")
+
+    if not any(k in s for k in _OFFICE_KEYWORDS):
+        return None, None, None
 
     for rx in (_CONTEST_RE, _CONTEST_RE2):
         m = rx.match(s)
@@ -237,7 +255,7 @@ def extract_jurisdiction_office_and_district(contest_name: str):
         district_raw = gd.get("district") or gd.get("qualifiers")
         if district_raw:
             district = (
-                re.sub(r"\s+", " ", district_raw.replace("-", " "))
+                _WS_RE.sub(" ", district_raw.replace("-", " "))
                 .title()
                 .strip()
             )
@@ -249,7 +267,24 @@ def extract_jurisdiction_office_and_district(contest_name: str):
     return None, None, None
 
 
-
-
-
-
+def extract_for_series(contest_names: pd.Series) -> pd.DataFrame:
+    """
+    Column version of :func:`extract_jurisdiction_office_and_district`.
+
+    Parses each distinct name once and broadcasts the results back by
+    position, returning ``jurisdiction`` / ``office`` / ``district`` columns
+    aligned to *contest_names*' index.  Missing names give ``None``.
+    """
+    codes, uniques = pd.factorize(contest_names)
+    # Trailing all-None row is what factorize's -1 (missing) code selects.
+    parsed = [extract_jurisdiction_office_and_district(u) for u in uniques]
+    parsed.append((None, None, None))
+    jurisdiction, office, district = (np.array(col, dtype=object) for col in zip(*parsed))
+    return pd.DataFrame(
+        {
+            "jurisdiction": jurisdiction[codes],
+            "office": office[codes],
+            "district": district[codes],
+        },
+        index=contest_names.index,
+    )
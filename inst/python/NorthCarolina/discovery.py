@@ -3,7 +3,7 @@ from __future__ import annotations
 import re
 from datetime import datetime
 import requests
-from lxml import html
+from lxml import etree
 
 from http_utils import DOWNBALLOT_UA
 from .models import NcElectionZip
@@ -14,26 +14,46 @@ ZIP_RE = re.compile(r"results_pct_(\d{8})\.zip$")
 _HEADERS = {"User-Agent": DOWNBALLOT_UA}
 
 
-def discover_northcarolina_results_zips() -> list[NcElectionZip]:
-    r = requests.get(INDEX_URL, headers=_HEADERS, timeout=30)
-    r.raise_for_status()
-    doc = html.fromstring(r.text)
+_FEED_CHUNK = 64 * 1024
+
+
+def _iter_zip_links(chunks):
+    """
+    Stream-parse the index page and yield ``(href, label)`` for each results
+    ZIP anchor.  Anchors are cleared once read, so no full document tree is
+    kept around for what is a handful of links.
+    """
+    parser = etree.HTMLPullParser(events=("end",), tag="a", encoding="utf-8", recover=True)
 
-    urls = doc.xpath("//a[contains(@href,'results_pct_') and contains(@href,'.zip')]/@href")
-    labels = doc.xpath("//a[contains(@href,'results_pct_') and contains(@href,'.zip')]/text()")
+    def _drain():
+        for _, a in parser.read_events():
+            href = a.get("href") or ""
+            if "results_pct_" in href and ".zip" in href:
+                yield href, "".join(a.itertext())
+            a.clear(keep_tail=True)
 
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from _drain()
+    parser.close()
+    yield from _drain()
+
+
+def discover_northcarolina_results_zips() -> list[NcElectionZip]:
     out: list[NcElectionZip] = []
-    for url, label in zip(urls, labels):
-        m = ZIP_RE.search(url)
-        if not m:
-            continue
-        d = datetime.strptime(m.group(1), "%Y%m%d").date()
-        out.append(
-            NcElectionZip(
-                election_date=d,
-                zip_url=url,
-                label=" ".join(label.split()),
+    with requests.get(INDEX_URL, headers=_HEADERS, timeout=30, stream=True) as r:
+        r.raise_for_status()
+        for url, label in _iter_zip_links(r.iter_content(_FEED_CHUNK)):
+            m = ZIP_RE.search(url)
+            if not m:
+                continue
+            d = datetime.strptime(m.group(1), "%Y%m%d").date()
+            out.append(
+                NcElectionZip(
+                    election_date=d,
+                    zip_url=url,
+                    label=" ".join(label.split()),
+                )
             )
-        )
 
     return sorted(out, key=lambda x: x.election_date)
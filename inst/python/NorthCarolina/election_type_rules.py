@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 from typing import Iterable
 from datetime import date, datetime
+import numpy as np
 import pandas as pd
 
 
@@ -32,15 +33,13 @@ def add_election_type(df: pd.DataFrame, rules: ElectionTypeRules) -> pd.DataFram
         df["election_type"] = pd.NA
         return df
 
-    def classify(d: object) -> object:
-        if pd.isna(d):
-            return pd.NA
-        # d should be a python date; be defensive anyway
-        if d in rules.general_dates:
-            return "General"
-        if d in rules.special_dates:
-            return "Special"
-        return rules.default
-
-    df["election_type"] = df["election_date"].apply(classify).astype("string")
+    dates = df["election_date"]
+    # isin hashes the date objects exactly like the set lookups did;
+    # np.select picks the first matching condition, so General wins ties.
+    labels = np.select(
+        [dates.isin(list(rules.general_dates)), dates.isin(list(rules.special_dates))],
+        ["General", "Special"],
+        default=rules.default,
+    )
+    df["election_type"] = pd.Series(labels, index=df.index, dtype="string").mask(dates.isna())
     return df
@@ -1,37 +1,204 @@
 from __future__ import annotations
 
+import hashlib
 import io
+import os
 import re
+import tempfile
+import threading
 import zipfile
+from email.utils import formatdate
+from pathlib import Path
+from typing import BinaryIO, Callable, Optional
 
 import pandas as pd
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 from http_utils import DOWNBALLOT_UA
 
 _HEADERS = {"User-Agent": DOWNBALLOT_UA}
 
+
+def _make_session() -> requests.Session:
+    """Keep-alive session shared by every NC download (ZIPs and range reads)."""
+    session = requests.Session()
+    session.headers.update(_HEADERS)
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_maxsize=8, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_SESSION = _make_session()
+
+# Word-boundary rules need a regex; the rest are plain substring tests
 _MEMBER_SCORE_RULES = [
-    (re.compile(r"results[_-]?pct", re.IGNORECASE), 200),
     (re.compile(r"\bresults\b", re.IGNORECASE), 40),
     (re.compile(r"\bpct\b", re.IGNORECASE), 20),
-    (re.compile(r"layout", re.IGNORECASE), -500),
-    (re.compile(r"readme|info|note", re.IGNORECASE), -500),
 ]
+_MEMBER_SUBSTRING_RULES = [
+    (("resultspct", "results_pct", "results-pct"), 200),
+    (("layout",), -500),
+    (("readme", "info", "note"), -500),
+]
+
+
+# zipfile reads members in small chunks; buffer range responses this large
+_RANGE_BLOCK = 1 << 20
+_DOWNLOAD_CHUNK = 1 << 20
+# Whole-archive fallback downloads larger than this spill to a temp file
+_SPOOL_MAX = 32 << 20
+
+# Optional on-disk ZIP cache (off by default), like html_cache for pages.
+# Entries are revalidated with a conditional GET, so an unchanged file costs
+# one 304 round trip instead of a full download.
+_ZIP_CACHE_DIR: Optional[Path] = (
+    Path(os.environ["DOWNBALLOT_NC_ZIP_CACHE"]) if os.environ.get("DOWNBALLOT_NC_ZIP_CACHE") else None
+)
+
+
+def set_zip_cache_dir(path: "str | Path | None") -> None:
+    """Enable the NC ZIP cache at *path*, or disable it with ``None``."""
+    global _ZIP_CACHE_DIR
+    _ZIP_CACHE_DIR = Path(path) if path else None
 
 
 def download_zip_bytes(zip_url: str, timeout: int = 60) -> bytes:
-    r = requests.get(zip_url, headers=_HEADERS, timeout=timeout)
+    r = _SESSION.get(zip_url, timeout=timeout)
     r.raise_for_status()
     return r.content
 
 
+def _download_to_spool(zip_url: str, timeout: int) -> tempfile.SpooledTemporaryFile:
+    """Stream *zip_url* into a seekable spool without building one big bytes object."""
+    spool = tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX)
+    try:
+        with _SESSION.get(zip_url, timeout=timeout, stream=True) as r:
+            r.raise_for_status()
+            for chunk in r.iter_content(_DOWNLOAD_CHUNK):
+                spool.write(chunk)
+    except BaseException:
+        spool.close()
+        raise
+    spool.seek(0)
+    return spool
+
+
+class _RangeReader(io.RawIOBase):
+    """Seekable read-only view of a remote file, fetched with HTTP Range requests."""
+
+    def __init__(self, url: str, size: int, timeout: int = 60) -> None:
+        self._url = url
+        self._size = size
+        self._timeout = timeout
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._pos
+        elif whence == io.SEEK_END:
+            offset += self._size
+        self._pos = max(0, offset)
+        return self._pos
+
+    def readinto(self, b) -> int:
+        end = min(self._pos + len(b), self._size)
+        if end <= self._pos:
+            return 0
+        r = _SESSION.get(
+            self._url,
+            headers={"Range": f"bytes={self._pos}-{end - 1}"},
+            timeout=self._timeout,
+        )
+        r.raise_for_status()
+        if r.status_code != 206:
+            raise OSError(f"Server ignored Range request for {self._url}")
+        n = len(r.content)
+        b[:n] = r.content
+        self._pos += n
+        return n
+
+
+def _cached_zip(zip_url: str, timeout: int) -> Path:
+    """Return the cached copy of *zip_url*, downloading or revalidating it first."""
+    path = _ZIP_CACHE_DIR / f"{hashlib.sha1(zip_url.encode('utf-8')).hexdigest()}.zip"
+    etag_path = path.with_suffix(".etag")
+
+    headers = {}
+    if path.exists():
+        headers["If-Modified-Since"] = formatdate(path.stat().st_mtime, usegmt=True)
+        if etag_path.exists():
+            headers["If-None-Match"] = etag_path.read_text(encoding="utf-8").strip()
+
+    try:
+        with _SESSION.get(zip_url, headers=headers, timeout=timeout, stream=True) as r:
+            if r.status_code == 304:
+                return path
+            r.raise_for_status()
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write-then-rename so concurrent readers never see a partial file.
+            tmp = path.with_suffix(f".{os.getpid()}-{threading.get_ident()}.tmp")
+            with open(tmp, "wb") as f:
+                for chunk in r.iter_content(_DOWNLOAD_CHUNK):
+                    f.write(chunk)
+            os.replace(tmp, path)
+            if r.headers.get("ETag"):
+                etag_path.write_text(r.headers["ETag"], encoding="utf-8")
+            return path
+    except (requests.RequestException, OSError):
+        if not path.exists():
+            raise
+        print(f"[WARN] Could not revalidate {zip_url}; using cached copy.")
+        return path
+
+
+def open_remote_zip(zip_url: str, timeout: int = 60) -> BinaryIO:
+    """
+    Open *zip_url* as a seekable binary file for ``zipfile.ZipFile``.
+
+    With the ZIP cache enabled (:func:`set_zip_cache_dir`) the archive is
+    opened from disk.  Otherwise, when the server advertises byte ranges,
+    only the central directory and the selected member are fetched; failing
+    that the whole archive is streamed into a spooled temporary file.
+    """
+    if _ZIP_CACHE_DIR is not None:
+        return open(_cached_zip(zip_url, timeout), "rb")
+
+    head = _SESSION.head(zip_url, timeout=timeout, allow_redirects=True)
+    size = head.headers.get("Content-Length")
+    if head.ok and head.headers.get("Accept-Ranges") == "bytes" and size:
+        return io.BufferedReader(_RangeReader(head.url, int(size), timeout), _RANGE_BLOCK)
+    return _download_to_spool(zip_url, timeout)
+
+
 def _score_member(name: str) -> int:
     score = 0
+    nl = name.lower()
+    for parts, s in _MEMBER_SUBSTRING_RULES:
+        if any(p in nl for p in parts):
+            score += s
     for rx, s in _MEMBER_SCORE_RULES:
         if rx.search(name):
             score += s
-    if name.lower().endswith((".txt", ".csv", ".tsv")):
+    if nl.endswith((".txt", ".csv", ".tsv")):
         score += 20
     return score
 
@@ -68,33 +235,67 @@ def _select_results_member(zf: zipfile.ZipFile) -> str:
     raise ValueError(f"Could not identify results file. Top candidate: {best} (score={best_score})")
 
 
-def _read_delimited(data: bytes, filename: str) -> pd.DataFrame:
-    # Strip embedded NUL bytes — some NC ZIP files contain \x00 padding that
-    # causes "Embedded NUL in string" errors when R receives the DataFrame.
-    data = data.replace(b"\x00", b"")
-    raw = io.BytesIO(data)
+# Enough of the member to hold its header line
+_SNIFF_BYTES = 1 << 16
 
-    lower = filename.lower()
-    if lower.endswith(".csv"):
-        return pd.read_csv(raw, sep=",", dtype=str, engine="python")
 
-    # try tab first
-    try:
-        raw.seek(0)
-        df = pd.read_csv(raw, sep="\t", dtype=str, engine="python")
-        if df.shape[1] > 1:
-            return df
-    except Exception:
-        pass
+def _sniff_sep(data: bytes) -> str:
+    """Tab if the header line has more tabs than commas, else comma."""
+    header = data[: data.find(b"\n")]
+    return "\t" if header.count(b"\t") > header.count(b",") else ","
+
+
+class _NulStripReader(io.RawIOBase):
+    """Read-only stream over *f* with embedded NUL bytes removed on the fly.
+
+    Some NC ZIP files contain \\x00 padding that causes "Embedded NUL in
+    string" errors when R receives the DataFrame.
+    """
+
+    def __init__(self, f: BinaryIO) -> None:
+        self._f = f
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        while True:
+            chunk = self._f.read(len(b))
+            if not chunk:
+                return 0
+            chunk = chunk.replace(b"\x00", b"")
+            if chunk:  # an all-NUL chunk is not EOF; read on
+                n = len(chunk)
+                b[:n] = chunk
+                return n
+
+
+def _read_delimited(open_member: Callable[[], BinaryIO], filename: str) -> pd.DataFrame:
+    """Parse a delimited member straight from its (decompressing) stream.
+
+    *open_member* returns a fresh binary stream; it is called again only if
+    the C tokenizer rejects the file and the python engine has to re-read it.
+    """
+    def _open() -> io.BufferedReader:
+        return io.BufferedReader(_NulStripReader(open_member()), _SNIFF_BYTES)
+
+    with _open() as f:
+        sep = "," if filename.lower().endswith(".csv") else _sniff_sep(f.peek(_SNIFF_BYTES))
+
+        # C tokenizer first; the python engine only for malformed files it rejects
+        try:
+            return pd.read_csv(f, sep=sep, dtype=str, engine="c")
+        except pd.errors.ParserError:
+            pass
 
-    # fallback comma
-    raw.seek(0)
-    return pd.read_csv(raw, sep=",", dtype=str, engine="python")
+    with _open() as f:
+        return pd.read_csv(f, sep=sep, dtype=str, engine="python")
 
 
-def read_results_pct_from_zip(zip_bytes: bytes) -> tuple[str, pd.DataFrame]:
-    with zipfile.ZipFile(io.BytesIO(zip_bytes)) as zf:
+def read_results_pct_from_zip(zip_file: bytes | BinaryIO) -> tuple[str, pd.DataFrame]:
+    if isinstance(zip_file, bytes):
+        zip_file = io.BytesIO(zip_file)
+    with zipfile.ZipFile(zip_file) as zf:
         member = _select_results_member(zf)
-        with zf.open(member) as f:
-            data = f.read()
-    return member, _read_delimited(data, member)
+        # The member is decompressed as the parser consumes it, never held whole
+        return member, _read_delimited(lambda: zf.open(member), member)
@@ -3,15 +3,17 @@ from __future__ import annotations
 import json
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from datetime import date, datetime
 from pathlib import Path
 from typing import Iterable, Optional, Sequence
 
+import numpy as np
 import pandas as pd
 
 from .election_type_rules import ElectionTypeRules, add_election_type
-from .canonicalize import extract_jurisdiction_office_and_district
-from office_level_utils import classify_office_level
+from .canonicalize import extract_for_series
+from office_level_utils import classify_office_level_series
 from text_utils import normalize_party
 
 # =========================================================
@@ -99,6 +101,16 @@ def load_northcarolina_results_config(config_path: str | Path) -> NcResultsConfi
 
 _WHITESPACE_RE = re.compile(r"\s+")
 
+# Arrow-backed strings strip natively and take a fraction of the memory of
+# Python-object strings; same StringDtype (pd.NA) semantics either way.
+try:
+    import pyarrow  # noqa: F401
+    _STRING_DTYPE = pd.StringDtype("pyarrow")
+except ImportError:
+    _STRING_DTYPE = pd.StringDtype()
+
+_TRAILING_PARTY_RE = re.compile(r"\(([^)]+)\)$")  # "... (DEM)" -> "DEM"
+
 
 # =========================================================
 # Office short-name extraction
@@ -146,6 +158,15 @@ def extract_office_short(full_name: object) -> object:
     return full_name
 
 
+def extract_office_short_series(full_names: pd.Series) -> pd.Series:
+    """Column version of :func:`extract_office_short`; each distinct name is matched once."""
+    codes, uniques = pd.factorize(full_names)
+    labels = np.array([extract_office_short(u) for u in uniques] + [pd.NA], dtype=object)
+    return pd.Series(labels[codes], index=full_names.index, name=full_names.name)
+
+
+# Files of one layout share header labels; normalize each label once.
+@lru_cache(maxsize=1024)
 def _norm_col(c: object) -> str:
     """Normalize raw column labels for robust matching."""
     return _WHITESPACE_RE.sub(" ", str(c).strip().lower())
@@ -178,6 +199,26 @@ def _parse_nc_date(x: object) -> object:
     return pd.NA
 
 
+def _parse_nc_dates(values: pd.Series, fallback: Optional[date] = None) -> pd.Series:
+    """Column version of :func:`_parse_nc_date`; each distinct string is parsed once.
+
+    Missing and unparseable values become *fallback* (NA when it is None).
+    """
+    # A results file carries one or two distinct dates across all its rows
+    codes, uniques = pd.factorize(values)
+    missing = pd.NA if fallback is None else fallback
+    parsed = [_parse_nc_date(u) for u in uniques]
+    parsed = np.array([missing if d is pd.NA else d for d in parsed] + [missing], dtype=object)
+    return pd.Series(parsed[codes], index=values.index, name=values.name)
+
+
+def _normalize_party_series(parties: pd.Series) -> pd.Series:
+    """Apply :func:`normalize_party` once per distinct party; missing gives ``""``."""
+    codes, uniques = pd.factorize(parties)
+    labels = np.array([normalize_party(u) for u in uniques] + [normalize_party(None)], dtype=object)
+    return pd.Series(labels[codes], index=parties.index, name=parties.name)
+
+
 def _layout_for_fallback(layouts: list[Layout], fallback_election_date: Optional[object]) -> Optional[Layout]:
     d = _as_date(fallback_election_date)
     if d is None:
@@ -231,8 +272,7 @@ def _shift_columns_into_first_row(df: pd.DataFrame, expected_cols: list[str]) ->
     """
     first_data_row = pd.DataFrame([list(df.columns)], columns=range(len(df.columns)))
 
-    body = df.copy()
-    body.columns = range(len(body.columns))
+    body = df.set_axis(range(len(df.columns)), axis=1)
 
     rebuilt = pd.concat([first_data_row, body], ignore_index=True)
     rebuilt.columns = expected_cols[: rebuilt.shape[1]]
@@ -251,35 +291,33 @@ def _ensure_expected_raw_layout(df: pd.DataFrame, layout: Layout) -> pd.DataFram
     """
     expected = layout.columns
 
+    # set_axis returns a new frame sharing df's data, so no branch copies it
     if _is_int_columns(df):  # A
-        out = df.copy()
-        out.columns = expected[: out.shape[1]]
-        return out
+        return df.set_axis(expected[: df.shape[1]], axis=1)
 
     if _df_columns_look_like_expected_header(df, expected):  # B
-        out = df.copy()
-        if out.shape[1] == len(expected):
-            out.columns = expected
-        return out
+        if df.shape[1] == len(expected):
+            return df.set_axis(expected, axis=1)
+        return df
 
     if _first_row_looks_like_expected_header(df, expected):  # C
-        out = df.copy()
-        out.columns = expected[: out.shape[1]]
+        out = df.set_axis(expected[: df.shape[1]], axis=1)
         return out.iloc[1:].reset_index(drop=True)
 
     if len(df.columns) == len(expected):  # D
         return _shift_columns_into_first_row(df, expected)
 
     # E
-    out = df.copy()
-    out.columns = expected[: out.shape[1]]
-    return out
+    return df.set_axis(expected[: df.shape[1]], axis=1)
 
 
 # =========================================================
 # Finalization for concat across years
 # =========================================================
 
+_DERIVED_STRING_COLS = ("jurisdiction", "district", "office_level", "choice_party")
+
+
 def _finalize_for_cross_year_concat(out: pd.DataFrame, schema: CanonicalSchema) -> pd.DataFrame:
     """
     Make output safe to concatenate across years:
@@ -288,9 +326,8 @@ def _finalize_for_cross_year_concat(out: pd.DataFrame, schema: CanonicalSchema)
       - coerce strings
       - add election_year
     """
-    df = out.copy()
-
-    df = df.reindex(columns=schema.join_cols)
+    # reindex already returns a new frame; the caller's `out` is not modified
+    df = out.reindex(columns=schema.join_cols)
 
     for col in schema.numeric_cols:
         if col in df.columns:
@@ -299,14 +336,14 @@ def _finalize_for_cross_year_concat(out: pd.DataFrame, schema: CanonicalSchema)
 
     for col in schema.string_cols:
         if col in df.columns:
-            df[col] = df[col].astype("string").str.strip().replace({"": pd.NA})
+            df[col] = df[col].astype(_STRING_DTYPE).str.strip().replace({"": pd.NA})
 
     if "election_date" in df.columns:
-        df["election_year"] = (
-            df["election_date"]
-            .apply(lambda d: d.year if pd.notna(d) else pd.NA)
-            .astype("Int64")
-        )
+        # election_date holds datetime.date objects (one or two distinct per
+        # file); take the year of each distinct date and broadcast it back.
+        codes, uniques = pd.factorize(df["election_date"])
+        years = pd.array([d.year for d in uniques] + [None], dtype="Int64")
+        df["election_year"] = years[codes]
     else:
         df["election_year"] = pd.NA
 
@@ -315,22 +352,24 @@ def _finalize_for_cross_year_concat(out: pd.DataFrame, schema: CanonicalSchema)
 
     # Extract jurisdiction and district from contest_name.
     # office is discarded — office_level replaces both it and the old contest_type column.
-    extracted = (
-        df["contest_name"]
-        .apply(extract_jurisdiction_office_and_district)
-        .apply(pd.Series)
-    )
-    df["jurisdiction"] = extracted[0]
-    # extracted[1] is the parsed office label — not exposed; office_level is used instead
-    df["district"] = extracted[2]
+    extracted = extract_for_series(df["contest_name"])
+    df["jurisdiction"] = extracted["jurisdiction"]
+    # extracted["office"] is the parsed office label — not exposed; office_level is used instead
+    df["district"] = extracted["district"]
 
     # office_level: classify from the full contest_name for maximum context.
-    df["office_level"] = df["contest_name"].apply(classify_office_level)
+    df["office_level"] = classify_office_level_series(df["contest_name"])
 
     df["choice_party"] = df["choice_party"].fillna(
-        df["contest_name"].str.extract(r"\(([^)]+)\)$", expand=False)
+        df["contest_name"].str.extract(_TRAILING_PARTY_RE, expand=False)
     )
-    df["choice_party"] = df["choice_party"].apply(normalize_party)
+    df["choice_party"] = _normalize_party_series(df["choice_party"])
+
+    # The derived columns are built from object arrays, whose inferred dtype
+    # depends on the file (all-None -> object).  Pin them to the string dtype
+    # of the other string columns so every election's frame has one schema and
+    # the cross-election concat never falls back to object columns.
+    df = df.astype({c: _STRING_DTYPE for c in _DERIVED_STRING_COLS})
 
     # Reorder: state, election_year, … contest_name | jurisdiction office_level district | vote cols …
     cols = df.columns.tolist()
@@ -351,11 +390,13 @@ def _finalize_for_cross_year_concat(out: pd.DataFrame, schema: CanonicalSchema)
 # =========================================================
 # Public API
 # =========================================================
-def get_config() -> NcResultsConfig:
-    _DEFAULT_CONFIG_PATH = Path(__file__).with_name("nc_results_pct_config.json")
-    _CONFIG: NcResultsConfig = load_northcarolina_results_config(_DEFAULT_CONFIG_PATH)
+_DEFAULT_CONFIG_PATH = Path(__file__).with_name("nc_results_pct_config.json")
 
-    return _CONFIG
+
+# The JSON is read once per process; callers treat the config as read-only.
+@lru_cache(maxsize=None)
+def get_config() -> NcResultsConfig:
+    return load_northcarolina_results_config(_DEFAULT_CONFIG_PATH)
 
 
 def normalize_northcarolina_results_cols(
@@ -371,8 +412,9 @@ def normalize_northcarolina_results_cols(
     """
     cfg = get_config()
 
-   # Work on a shallow copy to avoid mutating caller state
-    work = df.copy()
+    # Every step below (set_axis, rename, reindex) returns a new frame, so
+    # the caller's df is never modified and needs no defensive copy.
+    work = df
 
     # Select expected raw layout from fallback election date (if available)
     layout = _layout_for_fallback(cfg.layouts, fallback_election_date)
@@ -390,16 +432,13 @@ def normalize_northcarolina_results_cols(
     out = work.rename(columns=rename)
 
 
-    # election_date parsing + fallback fill (fill ANY NA, not just all-NA)
-    if "election_date" in out.columns:
-        out["election_date"] = out["election_date"].apply(_parse_nc_date)
-
+    # election_date parsing + fallback fill (fill ANY NA, not just all-NA);
+    # the fallback goes into the per-distinct-value table, not a second pass
     fb = _as_date(fallback_election_date)
-    if fb is not None:
-        if "election_date" not in out.columns:
-            out["election_date"] = fb
-        else:
-            out["election_date"] = out["election_date"].fillna(fb)
+    if "election_date" in out.columns:
+        out["election_date"] = _parse_nc_dates(out["election_date"], fb)
+    elif fb is not None:
+        out["election_date"] = fb
 
     # Add election_type BEFORE finalizing (finalizer reindexes columns and can drop it)
     out = add_election_type(out, cfg.election_type_rules)
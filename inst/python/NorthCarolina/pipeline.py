@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict
 from datetime import date
 from typing import Iterable
@@ -8,32 +9,87 @@ import warnings
 import pandas as pd
 
 from .discovery import discover_northcarolina_results_zips
+from .models import NcElectionZip
 from .selection import select_elections
-from .io_utils import download_zip_bytes, read_results_pct_from_zip
-from .normalize import normalize_northcarolina_results_cols, get_config, extract_office_short
+from .io_utils import open_remote_zip, read_results_pct_from_zip
+from .normalize import (
+    _STRING_DTYPE,
+    extract_office_short_series,
+    get_config,
+    normalize_northcarolina_results_cols,
+)
 from .aggregate import aggregate_to_county_level, aggregate_county_to_state
 from df_utils import concat_or_empty
 from date_utils import year_to_date_range
 from column_schemas import compute_vote_pct, drop_writeins
 
+# Elections scraped concurrently; each holds a full decompressed results file
+_MAX_WORKERS = 4
 
-def _get_attr(obj, name: str):
-    # supports either dataclass/obj or dict
-    if isinstance(obj, dict):
-        return obj[name]
-    return getattr(obj, name)
+
+def _empty_column_dtype(col: str, int_cols: set[str], nullable: bool):
+    """dtype a populated NC output frame gives *col*.
+
+    Precinct counts come out of normalize as nullable ``Int64``; the county
+    and state aggregates fill their vote columns and store plain ``int64``.
+    """
+    if col == "election_year":
+        return "Int64"
+    if col in int_cols:
+        return "Int64" if nullable else "int64"
+    if col == "vote_pct":
+        return "float64"
+    if col in ("winner", "county_winner"):
+        return "bool"
+    if col == "election_date":
+        return "object"  # datetime.date values
+    return _STRING_DTYPE
+
+
+def _empty_results() -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    """Empty precinct/county/state frames with the configured schemas and dtypes.
+
+    Typed columns keep an empty result from concatenating as object columns
+    and give R the same column classes as a populated result.
+    """
+    schema = get_config().schema
+    int_cols = set(schema.numeric_cols) | {"votes"}
+
+    def _empty(cols: list[str], nullable: bool) -> pd.DataFrame:
+        return pd.DataFrame({
+            c: pd.Series(dtype=_empty_column_dtype(c, int_cols, nullable)) for c in cols
+        })
+
+    return (
+        _empty(schema.join_cols + ["election_year"], nullable=True),
+        _empty(schema.county_cols, nullable=False),
+        _empty(schema.state_cols, nullable=False),
+    )
 
 
 class NcElectionPipeline:
     state = "NC"
 
     def discover(self):
-        # returns list[NcElectionZip] (or similar)
+        # returns list[NcElectionZip]
         return discover_northcarolina_results_zips()
 
-    def _filter_elections(self, elections, start_date: date | None, end_date: date | None):
-        # your selection.py should handle None bounds
-        return select_elections(elections, start_date=start_date, end_date=end_date)
+    def _filter_elections(
+        self,
+        elections,
+        start_date: date | None,
+        end_date: date | None,
+        min_supported_date: date | None = None,
+        max_supported_date: date | None = None,
+    ):
+        # returns (supported, skipped); selection.py handles None bounds
+        return select_elections(
+            elections,
+            start_date=start_date,
+            end_date=end_date,
+            hard_min=min_supported_date,
+            hard_max=max_supported_date,
+        )
 
     def run(
         self,
@@ -42,8 +98,6 @@ class NcElectionPipeline:
         min_supported_date: date | None = None,
         max_supported_date: date | None = None,
     ) -> tuple[pd.DataFrame, pd.DataFrame]:
-        cfg = get_config()
-
         all_elections = self.discover()
 
         if not all_elections:
@@ -53,29 +107,16 @@ class NcElectionPipeline:
                 "and XPath selector in discovery.py.",
                 stacklevel=2,
             )
-            precinct_empty = pd.DataFrame(columns=cfg.schema.join_cols + ["election_year"])
-            county_empty   = pd.DataFrame(columns=cfg.schema.county_cols)
-            state_empty    = pd.DataFrame(columns=cfg.schema.state_cols)
-            return precinct_empty, county_empty, state_empty
+            return _empty_results()
 
-        elections = self._filter_elections(
+        supported, skipped = self._filter_elections(
             all_elections,
             start_date=start_date,
             end_date=end_date,
+            min_supported_date=min_supported_date,
+            max_supported_date=max_supported_date,
         )
 
-        supported: list[object] = []
-        skipped: list[object] = []
-
-        for e in elections:
-            ed = _get_attr(e, "election_date")
-            if min_supported_date is not None and ed < min_supported_date:
-                skipped.append(e)
-            elif max_supported_date is not None and ed > max_supported_date:
-                skipped.append(e)
-            else:
-                supported.append(e)
-
         if skipped:
             lo = min_supported_date.isoformat() if min_supported_date else "–"
             hi = max_supported_date.isoformat() if max_supported_date else "–"
@@ -87,23 +128,31 @@ class NcElectionPipeline:
         precinct_frames: list[pd.DataFrame] = []
         county_frames: list[pd.DataFrame] = []
         state_frames : list[pd.DataFrame] = []
-        failed: list[tuple[object, Exception]] = []
+        failed: list[tuple[NcElectionZip, Exception]] = []
 
-        print(f"[NC] Scraping {len(supported)} election row(s)...")
-        for e in supported:
-            election_date = _get_attr(e, "election_date")
-            print(f"[NC]   {election_date}: downloading ZIP...", flush=True)
+        def _run(e):
+            print(f"[NC]   {e.election_date}: downloading ZIP...", flush=True)
             try:
-                precinct_df, county_df, state_df = self._scrape_one(e)
+                return e, self._scrape_one(e), None
+            except Exception as ex:
+                return e, None, ex
+
+        # Download, unzip and CSV parsing mostly release the GIL, so a few
+        # elections overlap well; map() keeps results in election order.
+        print(f"[NC] Scraping {len(supported)} election row(s)...")
+        with ThreadPoolExecutor(max_workers=_MAX_WORKERS) as pool:
+            for e, frames, err in pool.map(_run, supported):
+                if err is not None:
+                    failed.append((e, err))
+                    print(
+                        "[NC] WARNING: failed to scrape "
+                        f"{e.election_date} ({e.zip_url}): {err}"
+                    )
+                    continue
+                precinct_df, county_df, state_df = frames
                 precinct_frames.append(precinct_df)
                 county_frames.append(county_df)
                 state_frames.append(state_df)
-            except Exception as ex:
-                failed.append((e, ex))
-                print(
-                    "[NC] WARNING: failed to scrape "
-                    f"{election_date} ({_get_attr(e,'zip_url')}): {ex}"
-                )
 
         if failed:
             print(
@@ -119,12 +168,9 @@ class NcElectionPipeline:
                     f"This usually means the site is unreachable or its structure has changed. "
                     f"See the warning messages printed above for details."
                 )
-            precinct_empty = pd.DataFrame(columns=cfg.schema.join_cols + ["election_year"])
-            county_empty = pd.DataFrame(columns=cfg.schema.county_cols)
-            state_empty = pd.DataFrame(columns=cfg.schema.state_cols)
-            return precinct_empty, county_empty, state_empty
+            return _empty_results()
 
-        precinct_final = pd.concat(precinct_frames, ignore_index=True)
+        precinct_final = concat_or_empty(precinct_frames)
         county_final = concat_or_empty(county_frames)
         state_final  = concat_or_empty(state_frames)
 
@@ -134,13 +180,13 @@ class NcElectionPipeline:
         )
         return precinct_final, county_final, state_final
 
-    def _scrape_one(self, election) -> pd.DataFrame:
+    def _scrape_one(self, election: NcElectionZip) -> pd.DataFrame:
         cfg = get_config()
-        zip_url = _get_attr(election, "zip_url")
-        election_date = _get_attr(election, "election_date")
+        zip_url = election.zip_url
+        election_date = election.election_date
 
-        zip_bytes = download_zip_bytes(zip_url)
-        _member, raw = read_results_pct_from_zip(zip_bytes)
+        with open_remote_zip(zip_url) as zip_file:
+            _member, raw = read_results_pct_from_zip(zip_file)
 
         norm = normalize_northcarolina_results_cols(raw, fallback_election_date=election_date)
 
@@ -159,8 +205,8 @@ class NcElectionPipeline:
         # Rename contest_name → full_office_name; derive short office label for county/state
         county_df = county_df.rename(columns={"contest_name": "full_office_name"})
         state_df  = state_df.rename(columns={"contest_name": "full_office_name"})
-        county_df["office"] = county_df["full_office_name"].apply(extract_office_short)
-        state_df["office"]  = state_df["full_office_name"].apply(extract_office_short)
+        county_df["office"] = extract_office_short_series(county_df["full_office_name"])
+        state_df["office"]  = extract_office_short_series(state_df["full_office_name"])
 
         # Enforce canonical column order from schema
         county_df = county_df.reindex(columns=cfg.schema.county_cols)
@@ -177,14 +223,14 @@ class NcElectionPipeline:
             "total_votes":   "votes",
             "contest_name":  "full_office_name",
         })
-        norm["office"] = norm["full_office_name"].apply(extract_office_short)
+        norm["office"] = extract_office_short_series(norm["full_office_name"])
 
         norm = drop_writeins(norm)
 
         # Compute precinct-level vote_pct and precinct_winner
         contest_cols = ["state", "election_date", "county", "precinct", "full_office_name"]
         norm = compute_vote_pct(norm, contest_cols)
-        max_votes = norm.groupby(contest_cols, dropna=False)["votes"].transform("max")
+        max_votes = norm.groupby(contest_cols, dropna=False, sort=False)["votes"].transform("max")
         norm["precinct_winner"] = norm["votes"].eq(max_votes)
 
         print(f"[NC]   Done: {len(norm):,} precinct rows, {len(county_df):,} county rows.")
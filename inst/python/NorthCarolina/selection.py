@@ -16,29 +16,50 @@ def select_elections(
     date_: Optional[str | date] = None,
     start_date: Optional[str | date] = None,
     end_date: Optional[str | date] = None,
-) -> list[NcElectionZip]:
+    hard_min: Optional[date] = None,
+    hard_max: Optional[date] = None,
+) -> tuple[list[NcElectionZip], list[NcElectionZip]]:
+    """
+    Select elections in the requested window and split them on the hard bounds.
+
+    Returns ``(kept, skipped)``: *kept* lies inside both the requested window
+    and ``[hard_min, hard_max]``; *skipped* was requested but falls outside
+    the hard bounds.
+    """
     elections = list(elections)
     if not elections:
-        return []
+        return [], []
 
     if date_ is not None:
-        target = _parse_date(date_)
-        return [e for e in elections if e.election_date == target]
-
-    if start_date is not None:
-        start = _parse_date(start_date)
+        start = end = _parse_date(date_)
     else:
-        start = min(e.election_date for e in elections)
+        start = _parse_date(start_date) if start_date is not None else None
+        end = _parse_date(end_date) if end_date is not None else None
 
-    if end_date is not None:
-        end = _parse_date(end_date)
-    else:
-        end = max(e.election_date for e in elections)
+        # Fill a missing bound from the data in one pass (skipped when both given)
+        if start is None or end is None:
+            lo = hi = elections[0].election_date
+            for e in elections:
+                d = e.election_date
+                if d < lo:
+                    lo = d
+                elif d > hi:
+                    hi = d
+            start = lo if start is None else start
+            end = hi if end is None else end
 
-    if start > end:
-        raise ValueError("start_date cannot be after end_date")
+        if start > end:
+            raise ValueError("start_date cannot be after end_date")
 
-    return [
-        e for e in elections
-        if start <= e.election_date <= end
-    ]
+    # One pass yields both lists
+    kept: list[NcElectionZip] = []
+    skipped: list[NcElectionZip] = []
+    for e in elections:
+        d = e.election_date
+        if not start <= d <= end:
+            continue
+        if (hard_min is not None and d < hard_min) or (hard_max is not None and d > hard_max):
+            skipped.append(e)
+        else:
+            kept.append(e)
+    return kept, skipped
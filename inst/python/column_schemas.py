@@ -210,6 +210,7 @@ def compute_vote_pct(
     *,
     total_col: str | None = None,
     fill_missing_only: bool = False,
+    group_ids: pd.Series | None = None,
 ) -> pd.DataFrame:
     """Compute vote_pct as votes / contest_total * 100, rounded to 2 decimal places.
 
@@ -226,6 +227,10 @@ def compute_vote_pct(
     fill_missing_only : bool
         When True, only fills rows where vote_pct is currently null/NaN.
         Useful for parsers that extract vote_pct from HTML but miss some rows.
+    group_ids : pd.Series | None
+        Precomputed ``df.groupby(group_cols, dropna=False, sort=False).ngroup()`` codes.
+        Callers that group by the same keys again (e.g. for winners) pass
+        these so the keys are hashed only once.
     """
     if df.empty or "votes" not in df.columns:
         return df
@@ -238,9 +243,11 @@ def compute_vote_pct(
         denom = denom.replace(0, np.nan)
     else:
         present = [c for c in group_cols if c in df.columns]
-        if present:
+        if group_ids is not None or present:
+            if group_ids is None:
+                group_ids = df.groupby(present, dropna=False, sort=False).ngroup()
             denom = (
-                votes.groupby(df.groupby(present, dropna=False).ngroup())
+                votes.groupby(group_ids)
                 .transform("sum")
                 .astype("float64")
                 .replace(0, np.nan)
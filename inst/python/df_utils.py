@@ -8,8 +8,17 @@ import pandas as pd
 
 
 def concat_or_empty(frames: list[pd.DataFrame]) -> pd.DataFrame:
-    """Concatenate a list of DataFrames; return an empty DataFrame if the list is empty."""
-    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+    """Concatenate a list of DataFrames; return an empty DataFrame if the list is empty.
+
+    Callers collect per-year/per-county frames in a list and call this once at
+    the end, so each column is copied a single time (O(total rows)).  A single
+    frame is returned with a fresh index and no copy at all.
+    """
+    if not frames:
+        return pd.DataFrame()
+    if len(frames) == 1:
+        return frames[0].reset_index(drop=True)
+    return pd.concat(frames, ignore_index=True)
 
 
 def rows_to_dataframe(rows: list) -> pd.DataFrame:
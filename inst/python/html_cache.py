@@ -0,0 +1,124 @@
+"""
+Optional on-disk page cache shared across DownBallotR scrapers.
+
+Re-running a scrape (or backfilling one more year) re-downloads the same
+search and contest pages.  When a cache directory is configured, fetched
+pages are stored gzipped under ``<cache_dir>/<md5(url)>.html.gz`` and served
+from disk on later calls, skipping both the network and the polite sleep.
+
+The cache is off by default.  Enable it with :func:`set_cache_dir` or the
+``DOWNBALLOT_HTML_CACHE`` environment variable.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import os
+import threading
+import time
+from datetime import timedelta
+from pathlib import Path
+from typing import Callable, Optional
+
+_CACHE_DIR: Optional[Path] = (
+    Path(os.environ["DOWNBALLOT_HTML_CACHE"]) if os.environ.get("DOWNBALLOT_HTML_CACHE") else None
+)
+
+
+# Entries older than this many seconds are refetched (None = never expire)
+_EXPIRE_AFTER_S: Optional[float] = None
+
+
+def set_cache_dir(
+    path: "str | Path | None",
+    expire_after: "timedelta | float | None" = None,
+) -> None:
+    """Enable the page cache at *path*, or disable it with ``None``.
+
+    *expire_after* (a ``timedelta`` or seconds) makes older entries count as
+    misses; they are still served if the refetch fails (see ``allow_stale``).
+    """
+    global _CACHE_DIR, _EXPIRE_AFTER_S
+    _CACHE_DIR = Path(path) if path else None
+    if isinstance(expire_after, timedelta):
+        expire_after = expire_after.total_seconds()
+    _EXPIRE_AFTER_S = expire_after
+
+
+def cache_enabled() -> bool:
+    return _CACHE_DIR is not None
+
+
+def _cache_path(url: str) -> Path:
+    return _CACHE_DIR / f"{hashlib.md5(url.encode('utf-8')).hexdigest()}.html.gz"
+
+
+def cache_get(url: str, allow_stale: bool = False) -> Optional[str]:
+    """Return the cached page for *url*, or ``None`` on a miss / disabled cache.
+
+    Expired entries are misses unless *allow_stale* (used as a fallback when
+    the live fetch failed).
+    """
+    if _CACHE_DIR is None:
+        return None
+    path = _cache_path(url)
+    try:
+        if (
+            not allow_stale
+            and _EXPIRE_AFTER_S is not None
+            and time.time() - path.stat().st_mtime > _EXPIRE_AFTER_S
+        ):
+            return None
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            return f.read()
+    except (OSError, EOFError):
+        return None
+
+
+def cache_put(url: str, text: str) -> None:
+    """Store *text* for *url* (no-op when the cache is disabled)."""
+    if _CACHE_DIR is None:
+        return
+    path = _cache_path(url)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename so concurrent readers never see a partial file.
+        tmp = path.with_suffix(f".{os.getpid()}-{threading.get_ident()}.tmp")
+        with gzip.open(tmp, "wt", encoding="utf-8") as f:
+            f.write(text)
+        os.replace(tmp, path)
+    except OSError as e:
+        print(f"[WARN] Could not write page cache for {url}: {e}")
+
+
+def cached_fetch(
+    url: str,
+    fetch_fn: Callable[[str], str],
+    should_store: Optional[Callable[[str], bool]] = None,
+) -> str:
+    """Return ``fetch_fn(url)``, served from / saved to the page cache.
+
+    When *should_store* is given, a fetched page is only cached if it returns
+    True (e.g. the page parsed to at least one result row, so error and
+    interstitial pages are refetched next time).
+    """
+    text = cache_get(url)
+    if text is not None:
+        return text
+    try:
+        text = fetch_fn(url)
+    except Exception:
+        stale = cache_get(url, allow_stale=True)
+        if stale is None:
+            raise
+        print(f"[WARN] Fetch failed; serving expired cached copy of {url}")
+        return stale
+    if should_store is None or should_store(text):
+        cache_put(url, text)
+    return text
+
+
+def is_no_store(response) -> bool:
+    """True when an HTTP response forbids storing it (``Cache-Control: no-store``)."""
+    return "no-store" in (response.headers.get("Cache-Control") or "").lower()
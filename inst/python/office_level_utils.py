@@ -7,6 +7,10 @@ classify_office_level(office)
     Regex-only classification — fast, no state context needed.
     Suitable for scrapers that don't carry a state_key (CT, IN, LA, GA, UT, NC).
 
+classify_office_level_series(offices)
+    Column version of classify_office_level; runs the regexes once per
+    distinct office string.
+
 lookup_office_level(office, state_key=None)
     Registry-first classification with regex fallback.
     When state_key is provided, checks the state-specific exact-match registry
@@ -31,6 +35,9 @@ from __future__ import annotations
 
 import re
 
+import numpy as np
+import pandas as pd
+
 # ---------------------------------------------------------------------------
 # Federal offices  (regex)
 # ---------------------------------------------------------------------------
@@ -594,6 +601,21 @@ def classify_office_level(office: str | None) -> str:
     return "Local"
 
 
+def classify_office_level_series(offices: pd.Series) -> pd.Series:
+    """:func:`classify_office_level` for a whole column.
+
+    Office names repeat on every precinct/candidate row, so the regexes run
+    once per distinct value and the labels are broadcast back by position.
+    Missing values are ``'Local'``, like empty strings.
+    """
+    codes, uniques = pd.factorize(offices)
+    labels = np.array(
+        [classify_office_level(u) for u in uniques] + ["Local"], dtype=object
+    )
+    # factorize marks missing values with -1, which picks the trailing "Local".
+    return pd.Series(labels[codes], index=offices.index)
+
+
 def lookup_office_level(office: str | None, state_key: str | None = None) -> str:
     """Return ``'Federal'``, ``'State'``, or ``'Local'`` for an office string.
 
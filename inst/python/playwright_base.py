@@ -2,7 +2,7 @@
 Shared base Playwright client used by all browser-based scrapers in DownBallotR.
 
 Subclasses add site-specific navigation methods on top of the shared browser
-lifecycle (launch, stealth context, retry-goto, selector wait).
+lifecycle (launch or pooled browser, stealth context, retry-goto, selector wait).
 
 Current subclasses
 ------------------
@@ -12,6 +12,8 @@ Current subclasses
 
 from __future__ import annotations
 
+import atexit
+import threading
 import time
 from typing import Optional
 
@@ -32,6 +34,109 @@ _STEALTH_UA = (
 
 _SELECTOR_TIMEOUT_MS = 45_000
 
+_ANALYTICS_URL_PARTS = ("google-analytics.com", "googletagmanager.com", "doubleclick.net")
+
+_LAUNCH_ARGS = ["--disable-blink-features=AutomationControlled", "--no-sandbox"]
+
+
+def _new_stealth_context(browser: Browser) -> BrowserContext:
+    """Open a context with a realistic UA/viewport and the webdriver flag hidden."""
+    context = browser.new_context(
+        user_agent=_STEALTH_UA,
+        viewport={"width": 1280, "height": 800},
+        locale="en-US",
+        timezone_id="America/New_York",
+    )
+    context.add_init_script(
+        "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+    )
+    return context
+
+
+class PlaywrightPool:
+    """Reuse one Chromium process per thread across browser clients.
+
+    Launching Chromium costs seconds; a fresh ``BrowserContext`` costs
+    milliseconds and is just as isolated (cookies, storage).  Clients with
+    ``use_pool = True`` acquire a stealth context from the pool on
+    ``__enter__`` and close only that context on ``__exit__``, so consecutive
+    clients (years, states, counties) share the running browser.
+
+    Playwright's sync API is bound to the thread that started it, so the pool
+    keeps one Playwright driver + browser per (thread, headless) pair.  Threads
+    other than the main thread must call :meth:`close_thread` before they exit;
+    the ``atexit`` hook can only close the main thread's browser cleanly.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._started: list[tuple[Playwright, dict]] = []
+
+    def _browser(self, headless: bool) -> Browser:
+        local = self._local
+        if getattr(local, "playwright", None) is None:
+            local.playwright = sync_playwright().start()
+            local.browsers = {}
+            with self._lock:
+                self._started.append((local.playwright, local.browsers))
+        browser = local.browsers.get(headless)
+        if browser is None or not browser.is_connected():
+            browser = local.playwright.chromium.launch(headless=headless, args=_LAUNCH_ARGS)
+            local.browsers[headless] = browser
+        return browser
+
+    def warm(self, headless: bool = True) -> None:
+        """Launch the browser for the current thread ahead of the first job."""
+        self._browser(headless)
+
+    def acquire(self, headless: bool = True) -> BrowserContext:
+        """Return a new stealth context on the pooled browser."""
+        return _new_stealth_context(self._browser(headless))
+
+    def release(self, context: BrowserContext) -> None:
+        """Close a context obtained from :meth:`acquire`."""
+        try:
+            context.close()
+        except Exception:
+            pass  # browser already gone
+
+    @staticmethod
+    def _shutdown(playwright: Playwright, browsers: dict) -> None:
+        for browser in browsers.values():
+            try:
+                browser.close()
+            except Exception:
+                pass
+        try:
+            playwright.stop()
+        except Exception:
+            pass
+
+    def close_thread(self) -> None:
+        """Close the current thread's browser; call before a worker thread exits."""
+        local = self._local
+        playwright = getattr(local, "playwright", None)
+        if playwright is None:
+            return
+        with self._lock:
+            self._started = [e for e in self._started if e[0] is not playwright]
+        self._shutdown(playwright, local.browsers)
+        local.playwright = None
+        local.browsers = {}
+
+    def close(self) -> None:
+        """Close every pooled browser and stop their Playwright drivers."""
+        with self._lock:
+            started, self._started = self._started, []
+        for playwright, browsers in started:
+            self._shutdown(playwright, browsers)
+        self._local = threading.local()
+
+
+PLAYWRIGHT_POOL = PlaywrightPool()
+atexit.register(PLAYWRIGHT_POOL.close)
+
 
 class BasePlaywrightClient:
     """Shared headless browser infrastructure for DownBallotR scrapers.
@@ -46,8 +151,26 @@ class BasePlaywrightClient:
         Run browser in headless mode (default True).  Set False for debugging.
     sleep_s : float
         Seconds to wait after a page load to allow JS rendering to settle.
+
+    Attributes
+    ----------
+    use_pool : bool
+        Take the browser from :data:`PLAYWRIGHT_POOL` instead of launching one
+        per client (default False).  Only enable this for clients that run on
+        the main thread or whose worker threads call
+        ``PLAYWRIGHT_POOL.close_thread()``.
+    blocked_resource_types : frozenset of str
+        Playwright resource types aborted for every request in the context
+        (default: none).  Leave stylesheets alone for scrapers that wait on
+        element visibility.
+    block_analytics : bool
+        Also abort requests to common analytics/tag-manager hosts (default False).
     """
 
+    use_pool: bool = False
+    blocked_resource_types: frozenset = frozenset()
+    block_analytics: bool = False
+
     def __init__(self, headless: bool = True, sleep_s: float = 2.0):
         self.headless = headless
         self.sleep_s = sleep_s
@@ -59,34 +182,55 @@ class BasePlaywrightClient:
     # ── Context manager ────────────────────────────────────────────────────────
 
     def __enter__(self):
-        """Launch browser with stealth settings to bypass bot detection."""
-        self.playwright = sync_playwright().start()
-        self.browser = self.playwright.chromium.launch(
-            headless=self.headless,
-            args=["--disable-blink-features=AutomationControlled", "--no-sandbox"],
-        )
-        self.context = self.browser.new_context(
-            user_agent=_STEALTH_UA,
-            viewport={"width": 1280, "height": 800},
-            locale="en-US",
-            timezone_id="America/New_York",
-        )
-        self.context.add_init_script(
-            "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
-        )
+        """Launch browser (or reuse the pooled one) with stealth settings."""
+        if self.use_pool:
+            self.context = PLAYWRIGHT_POOL.acquire(self.headless)
+            self.browser = self.context.browser
+        else:
+            self.playwright = sync_playwright().start()
+            self.browser = self.playwright.chromium.launch(
+                headless=self.headless, args=_LAUNCH_ARGS
+            )
+            self.context = _new_stealth_context(self.browser)
+        if self.blocked_resource_types or self.block_analytics:
+            self.context.route("**/*", self._route_request)
         self.page = self.context.new_page()
         return self
 
     def __exit__(self, *args) -> None:
-        """Close browser and release all Playwright resources."""
-        if self.page:
-            self.page.close()
-        if self.context:
-            self.context.close()
-        if self.browser:
-            self.browser.close()
-        if self.playwright:
-            self.playwright.stop()
+        """Close this client's page and context, then its own browser if not pooled."""
+        if self.use_pool:
+            if self.page:
+                try:
+                    self.page.close()
+                except Exception:
+                    pass
+            if self.context:
+                PLAYWRIGHT_POOL.release(self.context)
+        else:
+            if self.page:
+                self.page.close()
+            if self.context:
+                self.context.close()
+            if self.browser:
+                self.browser.close()
+            if self.playwright:
+                self.playwright.stop()
+        self.page = None
+        self.context = None
+        self.browser = None
+        self.playwright = None
+
+    def _route_request(self, route) -> None:
+        """Abort heavy or irrelevant requests; let everything else through."""
+        request = route.request
+        if request.resource_type in self.blocked_resource_types or (
+            self.block_analytics
+            and any(part in request.url for part in _ANALYTICS_URL_PARTS)
+        ):
+            route.abort()
+        else:
+            route.continue_()
 
     # ── Navigation helpers ─────────────────────────────────────────────────────
 
@@ -11,7 +11,8 @@
 
 from __future__ import annotations
 
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
 
 from ._scrapers import (
     _scrape_ct,
@@ -22,16 +23,26 @@ from ._scrapers import (
     _scrape_nc,
     _scrape_ut,
 )
-from ._year_ranges import _YEAR_RANGES, _clamp_year_range
-
-import datetime
+from ._year_ranges import (
+    _ES_STATE_KEYS,
+    _SOURCE_BOUNDS,
+    _YEAR_RANGES,
+    _clamp_year_range,
+    _max_end,
+    _resolve_end,
+)
 
 
 # ── Source registry ───────────────────────────────────────────────────────────
 
-def _list_election_stats_states() -> List[str]:
+_SPACE_TO_UNDERSCORE = str.maketrans(" ", "_")
+
+
+@lru_cache(maxsize=1)
+def _list_election_stats_states() -> Tuple[str, ...]:
+    # Imported and sorted on first use only; the tuple keeps the cache immutable
     from ElectionStats.state_config import STATE_CONFIGS
-    return sorted(STATE_CONFIGS.keys())
+    return tuple(sorted(STATE_CONFIGS.keys()))
 
 
 _SOURCES: dict = {
@@ -80,11 +91,15 @@ _SOURCES: dict = {
 }
 
 
+# _SOURCES is static, so its names are sorted once
+_SOURCE_NAMES: Tuple[str, ...] = tuple(sorted(_SOURCES))
+
+
 # ── Public API ────────────────────────────────────────────────────────────────
 
 def list_sources() -> List[str]:
     """Return names of all registered scraper sources."""
-    return sorted(_SOURCES.keys())
+    return list(_SOURCE_NAMES)
 
 
 def list_states(source: str) -> List[str]:
@@ -95,12 +110,13 @@ def list_states(source: str) -> List[str]:
     source : str
         One of the names returned by list_sources().
     """
-    if source not in _SOURCES:
+    entry = _SOURCES.get(source)
+    if entry is None:
         raise ValueError(
-            f"Unknown source: {source!r}. Available: {list_sources()}"
+            f"Unknown source: {source!r}. Available: {list(_SOURCE_NAMES)}"
         )
-    states = _SOURCES[source]["states"]
-    return states() if callable(states) else list(states)
+    states = entry["states"]
+    return list(states()) if callable(states) else list(states)
 
 
 def get_available_years(source: str, state: "str | None" = None) -> dict:
@@ -123,44 +139,24 @@ def get_available_years(source: str, state: "str | None" = None) -> dict:
         raise ValueError(
             f"Unknown source: {source!r}. Available: {sorted(_YEAR_RANGES.keys())}"
         )
-    ranges = _YEAR_RANGES[source]
-    current_year = datetime.date.today().year
+    # Sources without a state dimension (and the ElectionStats aggregate)
+    # come straight from the bounds precomputed at import.
+    if source != "election_stats" or state is None:
+        return {
+            "start_year": _SOURCE_BOUNDS[source][0],
+            "end_year": _max_end(source),
+        }
 
-    if source == "northcarolina_results":
-        start, end = ranges["NC"]
-        return {"start_year": start, "end_year": end or current_year}
-
-    if source == "indiana_results":
-        start, end = ranges["IN"]
-        return {"start_year": start, "end_year": end or current_year}
-
-    if source == "georgia_results":
-        start, end = ranges["GA"]
-        return {"start_year": start, "end_year": end or current_year}
-
-    if source == "utah_results":
-        start, end = ranges["UT"]
-        return {"start_year": start, "end_year": end or current_year}
-
-    if source == "louisiana_results":
-        start, end = ranges["LA"]
-        return {"start_year": start, "end_year": end or current_year}
-
-    # election_stats — aggregate or per-state lookup
-    if state is None:
-        start_year = min(v[0] for v in ranges.values())
-        end_year   = max(v[1] or current_year for v in ranges.values())
-        return {"start_year": start_year, "end_year": end_year}
-
-    state_key = state.strip().lower().replace(" ", "_")
+    ranges = _YEAR_RANGES[source]
+    state_key = state.strip().lower().translate(_SPACE_TO_UNDERSCORE)
     if state_key not in ranges:
         raise ValueError(
             f"No year range recorded for state {state!r} "
             f"(looked up as {state_key!r}). "
-            f"Available: {sorted(ranges.keys())}"
+            f"Available: {list(_ES_STATE_KEYS)}"
         )
     start, end = ranges[state_key]
-    return {"start_year": start, "end_year": end or current_year}
+    return {"start_year": start, "end_year": _resolve_end(end)}
 
 
 def scrape(source: str, **kwargs) -> "object":
@@ -178,12 +174,13 @@ def scrape(source: str, **kwargs) -> "object":
     -------
     pd.DataFrame, or dict of DataFrames when level='all'.
     """
-    if source not in _SOURCES:
+    entry = _SOURCES.get(source)
+    if entry is None:
         raise ValueError(
-            f"Unknown source: {source!r}. Available: {list_sources()}"
+            f"Unknown source: {source!r}. Available: {list(_SOURCE_NAMES)}"
         )
 
-    result = _SOURCES[source]["scrape_fn"](**kwargs)
+    result = entry["scrape_fn"](**kwargs)
 
     # Count total rows across all returned DataFrames and notify the user
     # before the (potentially slow) reticulate Python→R transfer begins.
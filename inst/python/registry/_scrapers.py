@@ -11,11 +11,13 @@
 from __future__ import annotations
 
 import datetime
-
-import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
 
 from date_utils import validate_year_range, year_to_date_range
-from df_utils import concat_or_empty as _concat_or_empty
+
+if TYPE_CHECKING:  # pandas is loaded by the scrapers themselves, on first use
+    import pandas as pd
 
 from ._validators import (
     _to_year,
@@ -315,9 +317,11 @@ def _scrape_election_stats(
         Enable parallel county scraping for classic (requests-based) states.
     """
     from ElectionStats.state_config import get_state_config, STATE_CONFIGS
+    from df_utils import concat_or_empty as _concat_or_empty
     from ElectionStats.run_scrape_yearly import (
         scrape_one_year,
         _normalize_state,
+        _MAX_YEAR_WORKERS,
     )
 
     state_key = _normalize_state(state)
@@ -336,7 +340,11 @@ def _scrape_election_stats(
         year_to = datetime.date.today().year
 
     n_years = year_to - year_from + 1
-    method  = state_config["scraping_method"]
+    # Read the config once; every year reuses these values
+    method      = state_config["scraping_method"]
+    base_url    = state_config["base_url"]
+    search_path = state_config["search_path"]
+    url_style   = state_config.get("url_style", "path_params")
     print(
         f"[ElectionStats] Starting: {state_key} | "
         f"{year_from}–{year_to} ({n_years} year(s)) | "
@@ -348,35 +356,59 @@ def _scrape_election_stats(
     precinct_frames: list[pd.DataFrame] = []
     failed_years: list[int] = []
 
-    for year in range(year_from, year_to + 1):
+    def _scrape_year(year: int):
         print(f"[ElectionStats] Scraping {state_key} {year}...", flush=True)
         try:
-            s_df, c_df, p_df = scrape_one_year(
+            return year, scrape_one_year(
                 state_key=state_key,
                 state_name=state_key,
-                base_url=state_config["base_url"],
-                search_path=state_config["search_path"],
+                base_url=base_url,
+                search_path=search_path,
                 year=year,
                 parallel=parallel,
-                scraping_method=state_config["scraping_method"],
-                url_style=state_config.get("url_style", "path_params"),
+                scraping_method=method,
+                url_style=url_style,
                 level=level,
-            )
+            ), None
         except Exception as exc:
-            print(f"[ElectionStats] ERROR {state_key} {year}: {exc} — skipping year", flush=True)
-            failed_years.append(year)
-            continue
-        print(
-            f"[ElectionStats] {year}: "
-            f"{len(s_df):,} election rows, {len(c_df):,} county rows, "
-            f"{len(p_df):,} precinct rows"
-        )
-        if not s_df.empty:
-            state_frames.append(s_df)
-        if not c_df.empty:
-            county_frames.append(c_df)
-        if not p_df.empty:
-            precinct_frames.append(p_df)
+            return year, None, exc
+
+    # Years are independent, network-bound jobs; overlap a few of them.
+    # Playwright browsers are not thread-safe, so those states run serially
+    # on this thread and keep reusing its pooled browser.  map() yields in
+    # year order, so the output does not depend on timing.
+    years = range(year_from, year_to + 1)
+    year_workers = 1 if method == "playwright" else max(1, min(_MAX_YEAR_WORKERS, n_years))
+    pool = ThreadPoolExecutor(max_workers=year_workers) if year_workers > 1 else None
+    try:
+        year_results = pool.map(_scrape_year, years) if pool is not None else map(_scrape_year, years)
+        for year, frames, exc in year_results:
+            if exc is not None:
+                print(f"[ElectionStats] ERROR {state_key} {year}: {exc} — skipping year", flush=True)
+                failed_years.append(year)
+                continue
+            s_df, c_df, p_df = frames
+            print(
+                f"[ElectionStats] {year}: "
+                f"{len(s_df):,} election rows, {len(c_df):,} county rows, "
+                f"{len(p_df):,} precinct rows"
+            )
+            if not s_df.empty:
+                state_frames.append(s_df)
+            if not c_df.empty:
+                county_frames.append(c_df)
+            if not p_df.empty:
+                precinct_frames.append(p_df)
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+        if method == "playwright":
+            # Browsers are kept across years; release them with the call so the
+            # next Playwright scraper on this thread can start its own driver.
+            from ElectionStats.playwright_client import shutdown_browser_workers
+            from playwright_base import PLAYWRIGHT_POOL
+            shutdown_browser_workers()
+            PLAYWRIGHT_POOL.close_thread()
 
     if failed_years:
         if len(failed_years) == n_years:
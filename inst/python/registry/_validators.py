@@ -19,10 +19,13 @@ def _to_year(v, min_year: int = 1900) -> "int | None":
     """Coerce *v* to an integer year, accepting int/float/str/None."""
     if v is None:
         return None
-    try:
-        year = int(float(v))
-    except (TypeError, ValueError):
-        raise ValueError(f"Cannot convert {v!r} to a year integer.")
+    if type(v) is int:  # common case; skips the float round trip
+        year = v
+    else:
+        try:
+            year = int(v) if isinstance(v, float) else int(float(v))
+        except (TypeError, ValueError, OverflowError):
+            raise ValueError(f"Cannot convert {v!r} to a year integer.")
     if not (min_year <= year <= 2100):
         raise ValueError(f"Year must be between {min_year} and 2100; got {year}.")
     return year
@@ -44,6 +44,42 @@ _YEAR_RANGES: dict = {
 }
 
 
+def _aggregate_bounds(ranges: dict) -> "tuple[int, int | None, bool]":
+    """(earliest start, latest fixed end or None, any open-ended) over *ranges*."""
+    fixed_ends = [end for _, end in ranges.values() if end is not None]
+    return (
+        min(start for start, _ in ranges.values()),
+        max(fixed_ends) if fixed_ends else None,
+        len(fixed_ends) < len(ranges),
+    )
+
+
+# Sorted ElectionStats state keys, for error messages
+_ES_STATE_KEYS: "tuple[str, ...]" = tuple(sorted(_YEAR_RANGES["election_stats"]))
+
+# _YEAR_RANGES is static, so each source's overall bounds are computed once
+_SOURCE_BOUNDS: dict = {
+    source: _aggregate_bounds(ranges) for source, ranges in _YEAR_RANGES.items() if ranges
+}
+
+
+def _resolve_end(end: "int | None") -> int:
+    """*end*, or the current calendar year for an open-ended range.
+
+    The clock is read only when the range is actually open-ended.
+    """
+    return end if end is not None else datetime.date.today().year
+
+
+def _max_end(source: str) -> int:
+    """Latest year covered by *source*; open-ended ranges run to the current year."""
+    _, fixed_end, open_ended = _SOURCE_BOUNDS[source]
+    if not open_ended:
+        return fixed_end
+    current_year = datetime.date.today().year
+    return current_year if fixed_end is None else max(fixed_end, current_year)
+
+
 def _clamp_year_range(
     year_from: "int | None",
     year_to: "int | None",
@@ -61,15 +97,11 @@ def _clamp_year_range(
 
     Returns unchanged values if *source* is not in _YEAR_RANGES.
     """
-    ranges = _YEAR_RANGES.get(source)
-    if not ranges:
+    if source not in _SOURCE_BOUNDS:
         return year_from, year_to
 
-    current_year = datetime.datetime.now().year
-    starts = [r[0] for r in ranges.values()]
-    ends   = [r[1] if r[1] is not None else current_year for r in ranges.values()]
-    min_start = min(starts)
-    max_end   = max(ends)
+    min_start = _SOURCE_BOUNDS[source][0]
+    max_end   = _max_end(source)
 
     if year_from is not None and year_to is not None and year_from > year_to:
         raise ValueError(
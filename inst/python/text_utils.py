@@ -10,7 +10,8 @@ from typing import Optional
 
 def clean_text(s: str | None) -> str:
     """Normalise whitespace in a plain string."""
-    return re.sub(r"\s+", " ", s or "").strip()
+    # split() breaks on the same Unicode whitespace as \s and drops the ends
+    return " ".join(s.split()) if s else ""
 
 
 def clean_node(node) -> str: